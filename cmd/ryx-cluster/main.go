@@ -1,15 +1,21 @@
 package main
 
 import (
+	"bufio"
+	"bytes"
+	"context"
 	"encoding/json"
+	"errors"
 	"flag"
 	"fmt"
+	"io"
 	"log"
 	"net/http"
 	"os"
 	"os/exec"
+	"runtime"
+	"sort"
 	"strconv"
-	"strings"
 	"sync"
 	"syscall"
 	"time"
@@ -35,6 +41,9 @@ type ClusterConfig struct {
 	BatchSize    int
 	Parallel     bool
 	Profile      *ClusterProfile
+
+	// NodesPerProcess is how many nodes each ryx-node process hosts
+	NodesPerProcess int
 }
 
 // NodeInfo holds information about a running node
@@ -46,6 +55,64 @@ type NodeInfo struct {
 	Process  *exec.Cmd
 }
 
+// processHandle returns a handle for the node's process, if it can be found
+func (n *NodeInfo) processHandle() *os.Process {
+	if n.Process != nil {
+		return n.Process.Process
+	}
+	process, err := os.FindProcess(n.PID)
+	if err != nil {
+		return nil
+	}
+	return process
+}
+
+// waitForExit checks all outstanding processes in one sweep per tick until they have
+// exited or timeout elapses, and returns the PIDs that are still running
+func waitForExit(processes map[int]*os.Process, timeout time.Duration) []int {
+	pending := make(map[int]*os.Process, len(processes))
+	for pid, process := range processes {
+		pending[pid] = process
+	}
+
+	deadline := time.Now().Add(timeout)
+	for len(pending) > 0 && time.Now().Before(deadline) {
+		time.Sleep(20 * time.Millisecond)
+		for pid, process := range pending {
+			if !processRunning(process) {
+				delete(pending, pid)
+			}
+		}
+	}
+
+	remaining := make([]int, 0, len(pending))
+	for pid := range pending {
+		remaining = append(remaining, pid)
+	}
+	sort.Ints(remaining)
+	return remaining
+}
+
+// errProcessExited marks nodes whose process was found dead before querying them
+var errProcessExited = errors.New("node process is not running")
+
+// processAlive checks each distinct node PID once and reports, per node, whether its process is running
+func processAlive(nodes []*NodeInfo) []bool {
+	byPID := make(map[int]bool, len(nodes))
+	alive := make([]bool, len(nodes))
+	for j, nodeInfo := range nodes {
+		running, seen := byPID[nodeInfo.PID]
+		if !seen {
+			if process := nodeInfo.processHandle(); process != nil {
+				running = processRunning(process)
+			}
+			byPID[nodeInfo.PID] = running
+		}
+		alive[j] = running
+	}
+	return alive
+}
+
 // SerializableNodeInfo holds node info that can be JSON serialized
 type SerializableNodeInfo struct {
 	ID       string `json:"id"`
@@ -54,14 +121,95 @@ type SerializableNodeInfo struct {
 	PID      int    `json:"pid"`
 }
 
+// nodeStatus is the part of a node's /status response used by the cluster tool.
+// Decoding into a struct skips building a generic map of the whole response.
+type nodeStatus struct {
+	NeighborCount *int            `json:"neighbor_count"`
+	Neighbors     json.RawMessage `json:"neighbors"`
+	Diffusion     struct {
+		TotalMessages int `json:"total_messages"`
+	} `json:"diffusion"`
+}
+
+// neighborCount returns the reported neighbor count, falling back to the neighbor list
+func (st *nodeStatus) neighborCount() int {
+	if st.NeighborCount != nil {
+		return *st.NeighborCount
+	}
+
+	// Handle array-based neighbors
+	var neighborsArray []json.RawMessage
+	if json.Unmarshal(st.Neighbors, &neighborsArray) == nil {
+		return len(neighborsArray)
+	}
+
+	// Fallback to map-based counting for backward compatibility
+	var neighborsMap map[string]json.RawMessage
+	if json.Unmarshal(st.Neighbors, &neighborsMap) == nil {
+		return len(neighborsMap)
+	}
+	return 0
+}
+
+// nodeInfoSummary is the part of a node's /info response used by the cluster tool.
+// Message bodies are left undecoded since only the count is shown.
+type nodeInfoSummary struct {
+	Info map[string]json.RawMessage `json:"info"`
+}
+
+// injectRequest is the body posted to a node's /inject endpoint
+type injectRequest struct {
+	Content string `json:"content"`
+	Energy  int    `json:"energy"`
+	TTL     int    `json:"ttl"`
+}
+
+// injectResponse is the part of a node's /inject response used to track diffusion
+type injectResponse struct {
+	Info struct {
+		ID string `json:"id"`
+	} `json:"info"`
+}
+
+// hasMessage reports whether the node holds messageID, or any message when messageID is empty
+func (s *nodeInfoSummary) hasMessage(messageID string) bool {
+	if messageID == "" {
+		return len(s.Info) > 0
+	}
+	_, ok := s.Info[messageID]
+	return ok
+}
+
 // Cluster manages multiple ryx-node instances
 type Cluster struct {
 	config  *ClusterConfig
 	nodes   map[int]*NodeInfo
 	nodesMx sync.RWMutex
 	running bool
+
+	// client is shared by every node request so keep-alive connections are reused;
+	// each request carries its own timeout
+	client *http.Client
+
+	// readyPipes maps the read end of each started process's readiness pipe
+	// to the nodes it hosts (guarded by nodesMx)
+	readyPipes map[*os.File][]int
+
+	// Launch state shared by every process, prepared once per start: the resolved
+	// node binary, its common arguments and a single /dev/null handle for child stdio
+	nodeBinary string
+	launchArgs []string
+	devNull    *os.File
+
+	// processGroup is the process group every node process joins (the first process's PID),
+	// so Stop can signal the whole cluster at once
+	processGroup int
+	groupMx      sync.Mutex
 }
 
+// readyPipeSupported reports whether child processes can inherit a readiness pipe
+var readyPipeSupported = runtime.GOOS != "windows"
+
 func main() {
 	var (
 		command      = flag.String("cmd", "help", "Command: start, stop, status, inject, help, chaos, benchmark")
@@ -76,6 +224,7 @@ func main() {
 		nodeID       = flag.Int("node", 0, "Specific node ID (0-based) for injection")
 		batchSize    = flag.Int("batch-size", 10, "Number of nodes to start in parallel")
 		parallel     = flag.Bool("parallel", true, "Use parallel node operations")
+		perProcess   = flag.Int("nodes-per-process", 1, "Number of nodes hosted by each ryx-node process")
 	)
 	flag.Parse()
 
@@ -110,11 +259,18 @@ func main() {
 		BatchSize:    *batchSize,
 		Parallel:     *parallel,
 		Profile:      selectedProfile,
+
+		NodesPerProcess: *perProcess,
+	}
+
+	if config.NodesPerProcess < 1 {
+		config.NodesPerProcess = 1
 	}
 
 	cluster := &Cluster{
 		config: config,
 		nodes:  make(map[int]*NodeInfo),
+		client: &http.Client{},
 	}
 
 	switch *command {
@@ -193,37 +349,55 @@ func (c *Cluster) Start() error {
 	}
 	fmt.Printf("...\n")
 
+	// The probe above may have loaded a stale PID file; this start leads its own process group
+	c.processGroup = 0
+
+	if err := c.prepareLaunch(); err != nil {
+		return err
+	}
+	defer c.releaseLaunch()
+
 	if c.config.Parallel && c.config.Nodes > 3 {
 		return c.startNodesParallel()
-	} else {
-		return c.startNodesSequential()
 	}
+	return c.startNodesSequential()
+}
 
-	c.running = true
-
-	// Save PID file
-	err := c.SavePIDFile()
+// prepareLaunch resolves everything about launching a node that does not vary per process
+func (c *Cluster) prepareLaunch() error {
+	binary, err := exec.LookPath(c.config.NodeBinary)
 	if err != nil {
-		log.Printf("Warning: failed to save PID file: %v", err)
+		return fmt.Errorf("failed to locate node binary %s: %w", c.config.NodeBinary, err)
 	}
+	c.nodeBinary = binary
+	c.launchArgs = []string{"--cluster-id", c.config.ClusterID}
 
-	// Wait a moment for nodes to start up
-	fmt.Printf("Waiting for nodes to start up...\n")
-	time.Sleep(3 * time.Second)
-
+	// Without this, every child opens /dev/null separately for each of its three streams
+	devNull, err := os.OpenFile(os.DevNull, os.O_RDWR, 0)
+	if err != nil {
+		log.Printf("Warning: failed to open %s: %v", os.DevNull, err)
+	} else {
+		c.devNull = devNull
+	}
 	return nil
 }
 
+// releaseLaunch closes the launch resources once every process has been started
+func (c *Cluster) releaseLaunch() {
+	if c.devNull != nil {
+		c.devNull.Close()
+		c.devNull = nil
+	}
+}
+
 // startNodesSequential starts nodes one by one (original method)
 func (c *Cluster) startNodesSequential() error {
-	// Start each node
-	for i := 0; i < c.config.Nodes; i++ {
-		err := c.startSingleNode(i)
+	// Start each node process (no stagger needed, every node owns distinct ports)
+	for i := 0; i < c.config.Nodes; i += c.config.NodesPerProcess {
+		err := c.startNodeGroup(i)
 		if err != nil {
 			return fmt.Errorf("failed to start node %d: %w", i, err)
 		}
-		// Brief pause between starts
-		time.Sleep(100 * time.Millisecond)
 	}
 
 	c.running = true
@@ -233,11 +407,12 @@ func (c *Cluster) startNodesSequential() error {
 // startNodesParallel starts nodes in parallel batches for faster large cluster startup
 func (c *Cluster) startNodesParallel() error {
 	batchSize := c.config.BatchSize
+	perProcess := c.config.NodesPerProcess
 	fmt.Printf("  Using parallel startup with batch size: %d\n", batchSize)
 
-	// Start nodes in parallel batches
-	for batchStart := 0; batchStart < c.config.Nodes; batchStart += batchSize {
-		batchEnd := batchStart + batchSize
+	// Start node processes in parallel batches, back to back (each node owns distinct ports)
+	for batchStart := 0; batchStart < c.config.Nodes; batchStart += batchSize * perProcess {
+		batchEnd := batchStart + batchSize*perProcess
 		if batchEnd > c.config.Nodes {
 			batchEnd = c.config.Nodes
 		}
@@ -245,63 +420,156 @@ func (c *Cluster) startNodesParallel() error {
 		fmt.Printf("  Starting batch %d-%d...\n", batchStart, batchEnd-1)
 
 		// Start batch in parallel
-		errChan := make(chan error, batchEnd-batchStart)
-		for i := batchStart; i < batchEnd; i++ {
-			go func(nodeID int) {
-				errChan <- c.startSingleNode(nodeID)
+		errChan := make(chan error, batchSize)
+		launched := 0
+		for i := batchStart; i < batchEnd; i += perProcess {
+			go func(firstNode int) {
+				errChan <- c.startNodeGroup(firstNode)
 			}(i)
+			launched++
 		}
 
 		// Wait for batch to complete
-		for i := batchStart; i < batchEnd; i++ {
+		for i := 0; i < launched; i++ {
 			if err := <-errChan; err != nil {
 				return fmt.Errorf("failed to start node in batch: %w", err)
 			}
 		}
-
-		// Brief pause between batches
-		if batchEnd < c.config.Nodes {
-			time.Sleep(200 * time.Millisecond)
-		}
 	}
 
 	c.running = true
 	return c.saveAndWait()
 }
 
-// startSingleNode starts a single node with the given ID
-func (c *Cluster) startSingleNode(nodeID int) error {
-	nodePort := c.config.BasePort + nodeID
-	httpPort := c.config.BaseHTTPPort + nodeID
+// startNodeGroup starts one ryx-node process hosting up to NodesPerProcess nodes,
+// beginning with node firstNode on consecutive ports
+func (c *Cluster) startNodeGroup(firstNode int) error {
+	count := c.config.NodesPerProcess
+	if firstNode+count > c.config.Nodes {
+		count = c.config.Nodes - firstNode
+	}
+
+	nodePort := c.config.BasePort + firstNode
+	httpPort := c.config.BaseHTTPPort + firstNode
 
-	fmt.Printf("  Starting node %d: UDP:%d HTTP:%d\n", nodeID, nodePort, httpPort)
+	if count == 1 {
+		fmt.Printf("  Starting node %d: UDP:%d HTTP:%d\n", firstNode, nodePort, httpPort)
+	} else {
+		fmt.Printf("  Starting nodes %d-%d: UDP:%d-%d HTTP:%d-%d\n", firstNode, firstNode+count-1,
+			nodePort, nodePort+count-1, httpPort, httpPort+count-1)
+	}
 
-	cmd := exec.Command(c.config.NodeBinary,
+	// Shared arguments first, then the per-process ports and node count
+	args := make([]string, 0, len(c.launchArgs)+8)
+	args = append(args, c.launchArgs...)
+	args = append(args,
 		"--port", strconv.Itoa(nodePort),
 		"--http-port", strconv.Itoa(httpPort),
-		"--cluster-id", c.config.ClusterID,
+		"--nodes", strconv.Itoa(count),
 	)
+	cmd := exec.Command(c.nodeBinary, args...)
+	if c.devNull != nil {
+		cmd.Stdin = c.devNull
+		cmd.Stdout = c.devNull
+		cmd.Stderr = c.devNull
+	}
 
-	// Start the process
-	err := cmd.Start()
-	if err != nil {
-		return fmt.Errorf("failed to start node %d: %w", nodeID, err)
+	// The node writes to this pipe (its fd 3) once all of its nodes are listening
+	var readyRead, readyWrite *os.File
+	if readyPipeSupported {
+		var err error
+		readyRead, readyWrite, err = os.Pipe()
+		if err != nil {
+			log.Printf("Warning: failed to create readiness pipe for node %d: %v", firstNode, err)
+		} else {
+			cmd.ExtraFiles = []*os.File{readyWrite}
+			cmd.Args = append(cmd.Args, "--ready-fd", "3")
+		}
 	}
 
-	nodeInfo := &NodeInfo{
-		ID:       fmt.Sprintf("node_%d", nodeID),
-		Port:     nodePort,
-		HTTPPort: httpPort,
-		PID:      cmd.Process.Pid,
-		Process:  cmd,
+	// Start the process
+	cmd, err := c.startInGroup(cmd)
+	if readyWrite != nil {
+		// Only the child keeps the write end, so a crashed node shows up as EOF
+		readyWrite.Close()
+	}
+	if err != nil {
+		if readyRead != nil {
+			readyRead.Close()
+		}
+		return fmt.Errorf("failed to start node %d: %w", firstNode, err)
 	}
 
+	// Every hosted node shares the process handle
 	c.nodesMx.Lock()
-	c.nodes[nodeID] = nodeInfo
+	if readyRead != nil {
+		if c.readyPipes == nil {
+			c.readyPipes = make(map[*os.File][]int)
+		}
+		for i := 0; i < count; i++ {
+			c.readyPipes[readyRead] = append(c.readyPipes[readyRead], firstNode+i)
+		}
+	}
+	for i := 0; i < count; i++ {
+		c.nodes[firstNode+i] = &NodeInfo{
+			ID:       fmt.Sprintf("node_%d", firstNode+i),
+			Port:     nodePort + i,
+			HTTPPort: httpPort + i,
+			PID:      cmd.Process.Pid,
+			Process:  cmd,
+		}
+	}
 	c.nodesMx.Unlock()
 	return nil
 }
 
+// startInGroup starts cmd in the cluster's process group and returns the command that
+// was actually started. The first process started leads the group; the others wait for it
+// and then join. If the group has already disappeared (every process in it exited), joining
+// fails and a fresh group is started instead.
+func (c *Cluster) startInGroup(cmd *exec.Cmd) (*exec.Cmd, error) {
+	c.groupMx.Lock()
+	if c.processGroup == 0 {
+		defer c.groupMx.Unlock()
+		return cmd, c.startGroupLeader(cmd)
+	}
+	pgid := c.processGroup
+	c.groupMx.Unlock()
+
+	setProcessGroup(cmd, pgid)
+	err := cmd.Start()
+	if err == nil {
+		return cmd, nil
+	}
+
+	log.Printf("Warning: failed to join process group %d: %v; starting a new group", pgid, err)
+
+	// A command cannot be started twice, so retry with a copy
+	retry := exec.Command(cmd.Path, cmd.Args[1:]...)
+	retry.Stdin, retry.Stdout, retry.Stderr = cmd.Stdin, cmd.Stdout, cmd.Stderr
+	retry.ExtraFiles = cmd.ExtraFiles
+
+	c.groupMx.Lock()
+	defer c.groupMx.Unlock()
+	if c.processGroup != pgid {
+		// Another launch already replaced the group; join that one
+		setProcessGroup(retry, c.processGroup)
+		return retry, retry.Start()
+	}
+	return retry, c.startGroupLeader(retry)
+}
+
+// startGroupLeader starts cmd as the leader of a new process group for the cluster.
+// The caller must hold groupMx.
+func (c *Cluster) startGroupLeader(cmd *exec.Cmd) error {
+	setProcessGroup(cmd, 0)
+	if err := cmd.Start(); err != nil {
+		return err
+	}
+	c.processGroup = cmd.Process.Pid
+	return nil
+}
+
 // saveAndWait saves PID file and waits for node startup
 func (c *Cluster) saveAndWait() error {
 	// Save PID file
@@ -310,17 +578,105 @@ func (c *Cluster) saveAndWait() error {
 		log.Printf("Warning: failed to save PID file: %v", err)
 	}
 
-	// Wait a moment for nodes to start up
+	// Wait for nodes to start up, returning as soon as every node answers
 	fmt.Printf("Waiting for nodes to start up...\n")
 	startupTime := 3 * time.Second
 	if c.config.Nodes > 20 {
 		startupTime = 5 * time.Second // More time for large clusters
 	}
-	time.Sleep(startupTime)
+
+	if pending := c.waitForNodes(startupTime); pending > 0 {
+		log.Printf("Warning: %d nodes not ready after %v", pending, startupTime)
+	}
 
 	return nil
 }
 
+// waitForNodes waits until every node is ready or the timeout elapses.
+// Processes started with a readiness pipe report in directly; any node not confirmed
+// that way is polled on its /health endpoint. It returns the number of nodes that never became ready.
+func (c *Cluster) waitForNodes(timeout time.Duration) int {
+	indices, nodes := c.sortedNodes()
+
+	c.nodesMx.Lock()
+	readyPipes := c.readyPipes
+	c.readyPipes = nil
+	c.nodesMx.Unlock()
+
+	position := make(map[int]int, len(indices))
+	urls := make([]string, len(nodes))
+	for j, nodeInfo := range nodes {
+		position[indices[j]] = j
+		urls[j] = fmt.Sprintf("http://localhost:%d/health", nodeInfo.HTTPPort)
+	}
+
+	ready := make([]bool, len(nodes))
+	deadline := time.Now().Add(timeout)
+	for readyRead, group := range readyPipes {
+		if readSignal(readyRead, deadline) {
+			for _, i := range group {
+				ready[position[i]] = true
+			}
+		}
+		readyRead.Close()
+	}
+
+	// Every probe is bounded by the overall startup deadline as well as its own timeout
+	ctx, cancel := context.WithDeadline(context.Background(), deadline)
+	defer cancel()
+
+	for {
+		sweepNodes(nodes, func(j int, nodeInfo *NodeInfo) {
+			if !ready[j] {
+				ready[j] = c.getJSON(ctx, urls[j], 200*time.Millisecond, nil) == nil
+			}
+		})
+
+		pending := 0
+		for _, ok := range ready {
+			if !ok {
+				pending++
+			}
+		}
+
+		if pending == 0 || !sleepCtx(ctx, 50*time.Millisecond) {
+			return pending
+		}
+	}
+}
+
+// readSignal waits until deadline for the single ready byte a node writes to its pipe
+func readSignal(readyRead *os.File, deadline time.Time) bool {
+	if err := readyRead.SetReadDeadline(deadline); err != nil {
+		return false
+	}
+	var buf [1]byte
+	n, _ := readyRead.Read(buf[:])
+	return n == 1
+}
+
+// groupMembers returns the recorded node PIDs that are currently in the saved process group
+func (c *Cluster) groupMembers(nodes []*NodeInfo) map[int]bool {
+	members := make(map[int]bool)
+	if c.processGroup <= 0 {
+		return members
+	}
+
+	checked := make(map[int]bool, len(nodes))
+	for _, nodeInfo := range nodes {
+		if checked[nodeInfo.PID] {
+			continue
+		}
+		checked[nodeInfo.PID] = true
+
+		pgid, err := processGroupOf(nodeInfo.PID)
+		if err == nil && pgid == c.processGroup {
+			members[nodeInfo.PID] = true
+		}
+	}
+	return members
+}
+
 // Stop shuts down all nodes in the cluster
 func (c *Cluster) Stop() error {
 	// Load existing cluster info
@@ -329,53 +685,61 @@ func (c *Cluster) Stop() error {
 		return fmt.Errorf("no cluster found (PID file missing or invalid)")
 	}
 
-	c.nodesMx.RLock()
-	nodeCount := len(c.nodes)
-	nodesCopy := make(map[int]*NodeInfo)
-	for k, v := range c.nodes {
-		nodesCopy[k] = v
+	indices, nodes := c.sortedNodes()
+
+	fmt.Printf("Stopping %d nodes...\n", len(nodes))
+
+	// All nodes normally share one process group, so a single signal reaches every one.
+	// The saved group is only trusted if a recorded node process is still a member of it;
+	// a stale PID file could otherwise name a group that now belongs to something else.
+	inGroup := c.groupMembers(nodes)
+	groupSignalled := false
+	if len(inGroup) > 0 {
+		if err := signalProcessGroup(c.processGroup, syscall.SIGTERM); err == nil {
+			fmt.Printf("  Signalled process group %d\n", c.processGroup)
+			groupSignalled = true
+		}
 	}
-	c.nodesMx.RUnlock()
 
-	fmt.Printf("Stopping %d nodes...\n", nodeCount)
+	// Signal every node process outside the group (processes hosting several nodes are
+	// signalled once), then wait for all of them together so shutdowns overlap
+	processes := make(map[int]*os.Process)
+	for j, nodeInfo := range nodes {
+		if _, seen := processes[nodeInfo.PID]; seen {
+			continue
+		}
+
+		fmt.Printf("  Stopping node %d (PID: %d)\n", indices[j], nodeInfo.PID)
 
-	// Stop each node
-	for i, nodeInfo := range nodesCopy {
-		fmt.Printf("  Stopping node %d (PID: %d)\n", i, nodeInfo.PID)
+		process := nodeInfo.processHandle()
+		if process == nil {
+			continue
+		}
+		// Try graceful shutdown first
+		if !groupSignalled || !inGroup[nodeInfo.PID] {
+			process.Signal(syscall.SIGTERM)
+		}
+		processes[nodeInfo.PID] = process
 
 		if nodeInfo.Process != nil {
-			// Try graceful shutdown first
-			nodeInfo.Process.Process.Signal(syscall.SIGTERM)
-
-			// Wait a moment for graceful shutdown
-			done := make(chan error, 1)
-			go func() {
-				done <- nodeInfo.Process.Wait()
-			}()
-
-			select {
-			case <-done:
-				// Process exited gracefully
-			case <-time.After(2 * time.Second):
-				// Force kill if not graceful
-				fmt.Printf("    Force killing node %d\n", i)
-				nodeInfo.Process.Process.Kill()
-			}
-		} else {
-			// Kill by PID if process not available
-			process, err := os.FindProcess(nodeInfo.PID)
-			if err == nil {
-				process.Signal(syscall.SIGTERM)
-			}
+			// Reap our own children so they stop answering signals once they exit
+			go nodeInfo.Process.Wait()
 		}
 	}
 
+	// Force kill anything still running once the shared grace period is over
+	for _, pid := range waitForExit(processes, 2*time.Second) {
+		fmt.Printf("    Force killing PID %d\n", pid)
+		processes[pid].Kill()
+	}
+
 	// Remove PID file
 	os.Remove(c.config.PIDFile)
 	c.nodesMx.Lock()
 	c.nodes = make(map[int]*NodeInfo)
 	c.nodesMx.Unlock()
 	c.running = false
+	c.processGroup = 0
 
 	return nil
 }
@@ -401,64 +765,60 @@ func (c *Cluster) PrintStatus() {
 
 // PrintDetailedStatus shows detailed status of all nodes
 func (c *Cluster) PrintDetailedStatus() {
-	fmt.Printf("\nDetailed Cluster Status:\n")
+	// Build the whole report in one buffer so the terminal sees a single write
+	out := bufio.NewWriterSize(os.Stdout, 16*1024)
+	defer out.Flush()
 
-	c.nodesMx.RLock()
-	nodeCount := len(c.nodes)
-	nodesCopy := make(map[int]*NodeInfo)
-	for k, v := range c.nodes {
-		nodesCopy[k] = v
-	}
-	c.nodesMx.RUnlock()
+	fmt.Fprintf(out, "\nDetailed Cluster Status:\n")
+
+	indices, nodes := c.sortedNodes()
+	nodeCount := len(nodes)
+
+	fmt.Fprintf(out, "  Total nodes: %d\n", nodeCount)
+
+	// Query all nodes concurrently under one time budget for the whole sweep
+	ctx, cancel := context.WithTimeout(context.Background(), 3*time.Second)
+	defer cancel()
 
-	fmt.Printf("  Total nodes: %d\n", nodeCount)
+	// Nodes whose process has exited are reported without an HTTP round trip
+	alive := processAlive(nodes)
+	statuses := make([]*nodeStatus, nodeCount)
+	errs := make([]error, nodeCount)
+	sweepNodes(nodes, func(j int, nodeInfo *NodeInfo) {
+		if !alive[j] {
+			errs[j] = errProcessExited
+			return
+		}
+		statuses[j], errs[j] = c.getNodeStatus(ctx, nodeInfo.HTTPPort)
+	})
 
 	var totalNeighbors, totalMessages int
 
-	for i, nodeInfo := range nodesCopy {
-		fmt.Printf("\n  Node %d (PID: %d):\n", i, nodeInfo.PID)
-		fmt.Printf("    UDP: %d, HTTP: %d\n", nodeInfo.Port, nodeInfo.HTTPPort)
+	for j, nodeInfo := range nodes {
+		fmt.Fprintf(out, "\n  Node %d (PID: %d):\n", indices[j], nodeInfo.PID)
+		fmt.Fprintf(out, "    UDP: %d, HTTP: %d\n", nodeInfo.Port, nodeInfo.HTTPPort)
 
-		// Get node status via HTTP API
-		status, err := c.getNodeStatus(nodeInfo.HTTPPort)
+		status, err := statuses[j], errs[j]
 		if err != nil {
-			fmt.Printf("    Status: ERROR - %v\n", err)
+			fmt.Fprintf(out, "    Status: ERROR - %v\n", err)
 			continue
 		}
 
-		// Extract neighbor count
-		neighbors := 0
-		if neighborCount, ok := status["neighbor_count"].(float64); ok {
-			neighbors = int(neighborCount)
-			totalNeighbors += neighbors
-		} else if neighborsData, ok := status["neighbors"].(map[string]interface{}); ok {
-			// Fallback to map-based counting for backward compatibility
-			neighbors = len(neighborsData)
-			totalNeighbors += neighbors
-		} else if neighborsArray, ok := status["neighbors"].([]interface{}); ok {
-			// Handle array-based neighbors
-			neighbors = len(neighborsArray)
-			totalNeighbors += neighbors
-		}
-
-		// Extract diffusion info count
-		messages := 0
-		if diffusionData, ok := status["diffusion"].(map[string]interface{}); ok {
-			if totalMsgs, ok := diffusionData["total_messages"].(float64); ok {
-				messages = int(totalMsgs)
-				totalMessages += messages
-			}
-		}
+		// Extract neighbor and diffusion info counts
+		neighbors := status.neighborCount()
+		totalNeighbors += neighbors
+		messages := status.Diffusion.TotalMessages
+		totalMessages += messages
 
-		fmt.Printf("    Status: RUNNING\n")
-		fmt.Printf("    Neighbors: %d\n", neighbors)
-		fmt.Printf("    Messages: %d\n", messages)
+		fmt.Fprintf(out, "    Status: RUNNING\n")
+		fmt.Fprintf(out, "    Neighbors: %d\n", neighbors)
+		fmt.Fprintf(out, "    Messages: %d\n", messages)
 	}
 
-	fmt.Printf("\nSummary:\n")
-	fmt.Printf("  Average neighbors per node: %.1f\n", float64(totalNeighbors)/float64(nodeCount))
-	fmt.Printf("  Total information messages: %d\n", totalMessages)
-	fmt.Printf("\n")
+	fmt.Fprintf(out, "\nSummary:\n")
+	fmt.Fprintf(out, "  Average neighbors per node: %.1f\n", float64(totalNeighbors)/float64(nodeCount))
+	fmt.Fprintf(out, "  Total information messages: %d\n", totalMessages)
+	fmt.Fprintf(out, "\n")
 }
 
 // InjectInformation injects information into a specific node
@@ -478,10 +838,10 @@ func (c *Cluster) InjectInformation(content string, energy, ttl, targetNode int)
 	fmt.Printf("  TTL: %d seconds\n", ttl)
 
 	// Create injection request
-	requestData := map[string]interface{}{
-		"content": content,
-		"energy":  energy,
-		"ttl":     ttl,
+	requestData := injectRequest{
+		Content: content,
+		Energy:  energy,
+		TTL:     ttl,
 	}
 
 	requestJSON, err := json.Marshal(requestData)
@@ -492,12 +852,16 @@ func (c *Cluster) InjectInformation(content string, energy, ttl, targetNode int)
 	// Send injection request with timeout
 	url := fmt.Sprintf("http://localhost:%d/inject", nodeInfo.HTTPPort)
 
-	// Create HTTP client with timeout
-	client := &http.Client{
-		Timeout: 5 * time.Second, // 5 second timeout for injection
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second) // 5 second timeout for injection
+	defer cancel()
+
+	req, err := http.NewRequestWithContext(ctx, http.MethodPost, url, bytes.NewReader(requestJSON))
+	if err != nil {
+		return fmt.Errorf("failed to create injection request: %w", err)
 	}
+	req.Header.Set("Content-Type", "application/json")
 
-	resp, err := client.Post(url, "application/json", strings.NewReader(string(requestJSON)))
+	resp, err := c.client.Do(req)
 	if err != nil {
 		return fmt.Errorf("failed to send injection request: %w", err)
 	}
@@ -507,32 +871,28 @@ func (c *Cluster) InjectInformation(content string, energy, ttl, targetNode int)
 		return fmt.Errorf("injection request failed with status: %s", resp.Status)
 	}
 
+	var injected injectResponse
+	if err := json.NewDecoder(resp.Body).Decode(&injected); err != nil {
+		log.Printf("Warning: could not decode injection response: %v", err)
+	}
+
 	fmt.Printf("Information injected successfully!\n")
 
-	// Wait a moment and show the diffusion progress
+	// Poll the nodes until the message has reached all of them (or the wait runs out)
 	fmt.Printf("Waiting for diffusion...\n")
-	time.Sleep(2 * time.Second)
+	indices, nodes := c.sortedNodes()
+	infos, errs := c.waitForDiffusion(nodes, injected.Info.ID, 2*time.Second)
 
 	fmt.Printf("\nDiffusion status:\n")
 
-	c.nodesMx.RLock()
-	nodesCopy2 := make(map[int]*NodeInfo)
-	for k, v := range c.nodes {
-		nodesCopy2[k] = v
-	}
-	c.nodesMx.RUnlock()
-
-	for i, node := range nodesCopy2 {
-		info, err := c.getNodeInfo(node.HTTPPort)
-		if err != nil {
+	for j, info := range infos {
+		i := indices[j]
+		if errs[j] != nil {
 			fmt.Printf("  Node %d: ERROR getting info\n", i)
 			continue
 		}
 
-		count := 0
-		if infoData, ok := info["info"].(map[string]interface{}); ok {
-			count = len(infoData)
-		}
+		count := len(info.Info)
 
 		if count > 0 {
 			fmt.Printf("  Node %d: Has %d messages\n", i, count)
@@ -544,44 +904,150 @@ func (c *Cluster) InjectInformation(content string, energy, ttl, targetNode int)
 	return nil
 }
 
+// sortedNodes returns a snapshot of the cluster's nodes ordered by node index
+func (c *Cluster) sortedNodes() ([]int, []*NodeInfo) {
+	c.nodesMx.RLock()
+	defer c.nodesMx.RUnlock()
+
+	indices := make([]int, 0, len(c.nodes))
+	for i := range c.nodes {
+		indices = append(indices, i)
+	}
+	sort.Ints(indices)
+
+	nodes := make([]*NodeInfo, len(indices))
+	for j, i := range indices {
+		nodes[j] = c.nodes[i]
+	}
+	return indices, nodes
+}
+
 // getNodeStatus gets status from a node's HTTP API with timeout
-func (c *Cluster) getNodeStatus(httpPort int) (map[string]interface{}, error) {
+func (c *Cluster) getNodeStatus(ctx context.Context, httpPort int) (*nodeStatus, error) {
 	url := fmt.Sprintf("http://localhost:%d/status", httpPort)
 
-	// Create HTTP client with timeout
-	client := &http.Client{
-		Timeout: 3 * time.Second, // 3 second timeout
+	var status nodeStatus
+	if err := c.getJSON(ctx, url, 3*time.Second, &status); err != nil {
+		return nil, err
 	}
+	return &status, nil
+}
 
-	resp, err := client.Get(url)
-	if err != nil {
+// getNodeInfo gets info from a node's HTTP API with timeout
+func (c *Cluster) getNodeInfo(ctx context.Context, httpPort int) (*nodeInfoSummary, error) {
+	url := fmt.Sprintf("http://localhost:%d/info", httpPort)
+
+	var info nodeInfoSummary
+	if err := c.getJSON(ctx, url, 3*time.Second, &info); err != nil {
 		return nil, err
 	}
-	defer resp.Body.Close()
+	return &info, nil
+}
+
+// waitForDiffusion polls /info on the given nodes until every one of them holds
+// messageID (any message if the ID is unknown) or timeout elapses. Requests still in
+// flight at the deadline are cancelled. It returns the latest response, or error, from each node.
+func (c *Cluster) waitForDiffusion(nodes []*NodeInfo, messageID string, timeout time.Duration) ([]*nodeInfoSummary, []error) {
+	infos := make([]*nodeInfoSummary, len(nodes))
+	errs := make([]error, len(nodes))
+	reached := make([]bool, len(nodes))
+
+	// Nodes whose process has exited will never receive the message; leave them out of the wait
+	alive := processAlive(nodes)
+	for j := range nodes {
+		if !alive[j] {
+			errs[j] = errProcessExited
+		}
+	}
 
-	var status map[string]interface{}
-	err = json.NewDecoder(resp.Body).Decode(&status)
-	return status, err
+	ctx, cancel := context.WithTimeout(context.Background(), timeout)
+	defer cancel()
+
+	for {
+		// Query the live nodes the message has not reached yet
+		sweepNodes(nodes, func(j int, nodeInfo *NodeInfo) {
+			if reached[j] || !alive[j] {
+				return
+			}
+			info, err := c.getNodeInfo(ctx, nodeInfo.HTTPPort)
+			if err != nil && ctx.Err() != nil && infos[j] != nil {
+				return // Cut off by the deadline; keep the node's last answer
+			}
+			infos[j], errs[j] = info, err
+		})
+
+		pending := 0
+		for j, info := range infos {
+			if !alive[j] {
+				continue
+			}
+			if errs[j] == nil && info.hasMessage(messageID) {
+				reached[j] = true
+			} else {
+				pending++
+			}
+		}
+
+		if pending == 0 || !sleepCtx(ctx, 50*time.Millisecond) {
+			return infos, errs
+		}
+	}
 }
 
-// getNodeInfo gets info from a node's HTTP API with timeout
-func (c *Cluster) getNodeInfo(httpPort int) (map[string]interface{}, error) {
-	url := fmt.Sprintf("http://localhost:%d/info", httpPort)
+// sweepNodes runs query for every node concurrently and returns once all have finished.
+// query gets the node's position in nodes, so results can be stored in per-sweep slices.
+func sweepNodes(nodes []*NodeInfo, query func(j int, nodeInfo *NodeInfo)) {
+	var wg sync.WaitGroup
+	for j, nodeInfo := range nodes {
+		wg.Add(1)
+		go func(j int, nodeInfo *NodeInfo) {
+			defer wg.Done()
+			query(j, nodeInfo)
+		}(j, nodeInfo)
+	}
+	wg.Wait()
+}
 
-	// Create HTTP client with timeout
-	client := &http.Client{
-		Timeout: 3 * time.Second, // 3 second timeout
+// sleepCtx pauses for d and reports false if ctx ends first
+func sleepCtx(ctx context.Context, d time.Duration) bool {
+	timer := time.NewTimer(d)
+	defer timer.Stop()
+
+	select {
+	case <-timer.C:
+		return true
+	case <-ctx.Done():
+		return false
 	}
+}
+
+// getJSON fetches url with the shared client and decodes the response into v.
+// The request ends after timeout or when ctx does, whichever comes first.
+// A nil v only checks that the node answered with 200 OK.
+func (c *Cluster) getJSON(ctx context.Context, url string, timeout time.Duration, v interface{}) error {
+	ctx, cancel := context.WithTimeout(ctx, timeout)
+	defer cancel()
 
-	resp, err := client.Get(url)
+	req, err := http.NewRequestWithContext(ctx, http.MethodGet, url, nil)
 	if err != nil {
-		return nil, err
+		return err
+	}
+
+	resp, err := c.client.Do(req)
+	if err != nil {
+		return err
 	}
 	defer resp.Body.Close()
 
-	var info map[string]interface{}
-	err = json.NewDecoder(resp.Body).Decode(&info)
-	return info, err
+	if resp.StatusCode != http.StatusOK {
+		return fmt.Errorf("unexpected status: %s", resp.Status)
+	}
+	if v == nil {
+		// Drain the body so the connection can be reused
+		_, err = io.Copy(io.Discard, resp.Body)
+		return err
+	}
+	return json.NewDecoder(resp.Body).Decode(v)
 }
 
 // SavePIDFile saves cluster information to PID file
@@ -603,6 +1069,7 @@ func (c *Cluster) SavePIDFile() error {
 	}
 	c.nodesMx.RUnlock()
 	data["nodes"] = serializableNodes
+	data["process_group"] = c.processGroup
 
 	jsonData, err := json.MarshalIndent(data, "", "  ")
 	if err != nil {
@@ -625,6 +1092,10 @@ func (c *Cluster) LoadFromPIDFile() error {
 		return err
 	}
 
+	if pgid, ok := clusterData["process_group"].(float64); ok {
+		c.processGroup = int(pgid)
+	}
+
 	// Load nodes from serializable format
 	if nodesData, ok := clusterData["nodes"].(map[string]interface{}); ok {
 		for key, nodeData := range nodesData {
@@ -649,7 +1120,8 @@ func (c *Cluster) LoadFromPIDFile() error {
 
 // PrintHelp shows usage information
 func (c *Cluster) PrintHelp() {
-	fmt.Printf(`
+	// Written as-is: the examples contain a literal "date +%s"
+	os.Stdout.WriteString(`
 ryx-cluster - Local cluster management for ryx distributed computing
 
 COMMANDS:
@@ -666,6 +1138,7 @@ FLAGS:
   -profile STRING       Cluster profile: small, medium, large, huge
   -batch-size N         Parallel startup batch size (default: 10)
   -parallel             Use parallel node operations (default: true)
+  -nodes-per-process N  Nodes hosted by each ryx-node process (default: 1)
   -base-port N          Base UDP port (default: 9010)  
   -base-http-port N     Base HTTP port (default: 8010)
   -cluster-id STRING    Cluster identifier (default: "test")
@@ -689,6 +1162,9 @@ EXAMPLES:
   # Large cluster with custom parallel settings
   ./ryx-cluster -cmd start -nodes 25 -batch-size 8 -parallel
 
+  # Host 5 nodes per process (5 processes instead of 25)
+  ./ryx-cluster -cmd start -nodes 25 -nodes-per-process 5
+
   # Show detailed status (neighbors, message counts)
   ./ryx-cluster -cmd status
 
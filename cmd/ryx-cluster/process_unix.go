@@ -0,0 +1,29 @@
+//go:build !windows
+
+package main
+
+import (
+	"os"
+	"os/exec"
+	"syscall"
+)
+
+// setProcessGroup places the child in process group pgid (0 makes it lead a new group)
+func setProcessGroup(cmd *exec.Cmd, pgid int) {
+	cmd.SysProcAttr = &syscall.SysProcAttr{Setpgid: true, Pgid: pgid}
+}
+
+// signalProcessGroup delivers sig to every process in the group with a single kill(2)
+func signalProcessGroup(pgid int, sig syscall.Signal) error {
+	return syscall.Kill(-pgid, sig)
+}
+
+// processRunning reports whether the process still exists, using the null signal
+func processRunning(process *os.Process) bool {
+	return process.Signal(syscall.Signal(0)) == nil
+}
+
+// processGroupOf returns the process group the process belongs to
+func processGroupOf(pid int) (int, error) {
+	return syscall.Getpgid(pid)
+}
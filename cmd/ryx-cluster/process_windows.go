@@ -0,0 +1,28 @@
+//go:build windows
+
+package main
+
+import (
+	"errors"
+	"os"
+	"os/exec"
+	"syscall"
+)
+
+// setProcessGroup is a no-op on Windows; nodes are signalled one by one
+func setProcessGroup(cmd *exec.Cmd, pgid int) {}
+
+// signalProcessGroup is not supported on Windows
+func signalProcessGroup(pgid int, sig syscall.Signal) error {
+	return errors.New("process group signals are not supported on windows")
+}
+
+// processRunning assumes a process found by handle is running; Windows has no null signal
+func processRunning(process *os.Process) bool {
+	return true
+}
+
+// processGroupOf is not supported on Windows
+func processGroupOf(pid int) (int, error) {
+	return 0, errors.New("process groups are not supported on windows")
+}
@@ -1,23 +1,41 @@
 package main
 
 import (
+	"bytes"
+	"context"
 	"encoding/json"
 	"flag"
 	"fmt"
 	"html/template"
+	"io"
 	"log"
 	"net/http"
-	"sort"
 	"strconv"
-	"strings"
+	"sync"
 	"time"
 )
 
+const (
+	scanTimeout  = 2 * time.Second // Per-node status probes during discovery
+	proxyTimeout = 5 * time.Second // Requests forwarded to a node on behalf of the browser
+)
+
 type DashboardServer struct {
 	port         int
 	startPort    int
 	endPort      int
 	httpTemplate *template.Template
+	client       *http.Client
+	endpoints    []nodeEndpoint
+}
+
+// nodeEndpoint holds the precomputed ports and URLs for one scanned node slot
+type nodeEndpoint struct {
+	httpPort   int
+	nodePort   int
+	statusURL  string
+	computeURL string
+	chemURL    string
 }
 
 type NodeInfo struct {
@@ -51,85 +69,111 @@ func NewDashboardServer(port, startPort, endPort int) (*DashboardServer, error)
 		startPort:    startPort,
 		endPort:      endPort,
 		httpTemplate: tmpl,
+		client:       &http.Client{}, // Timeouts are set per request via context
+		endpoints:    buildEndpoints(startPort, endPort),
 	}, nil
 }
 
-func (ds *DashboardServer) discoverCluster() ClusterStatus {
-	var nodes []NodeInfo
-	activeCount := 0
+// buildEndpoints computes the scan targets once, in port order
+func buildEndpoints(startPort, endPort int) []nodeEndpoint {
+	var endpoints []nodeEndpoint
+	for httpPort := startPort; httpPort <= endPort; httpPort++ {
+		base := fmt.Sprintf("http://localhost:%d", httpPort)
+		endpoints = append(endpoints, nodeEndpoint{
+			httpPort:   httpPort,
+			nodePort:   httpPort + 1000, // HTTP port is UDP port - 1000
+			statusURL:  base + "/status",
+			computeURL: base + "/compute",
+			chemURL:    base + "/chemistry/stats",
+		})
+	}
+	return endpoints
+}
 
-	// Scan port range for active nodes
-	for httpPort := ds.startPort; httpPort <= ds.endPort; httpPort++ {
-		nodePort := httpPort + 1000 // HTTP port is UDP port - 1000
+// getJSON fetches url with the shared client and decodes the response body into v
+func (ds *DashboardServer) getJSON(url string, v interface{}) error {
+	ctx, cancel := context.WithTimeout(context.Background(), scanTimeout)
+	defer cancel()
 
-		client := &http.Client{Timeout: 2 * time.Second}
-		resp, err := client.Get(fmt.Sprintf("http://localhost:%d/status", httpPort))
+	req, err := http.NewRequestWithContext(ctx, http.MethodGet, url, nil)
+	if err != nil {
+		return err
+	}
+	resp, err := ds.client.Do(req)
+	if err != nil {
+		return err
+	}
+	defer resp.Body.Close()
+	return json.NewDecoder(resp.Body).Decode(v)
+}
 
-		node := NodeInfo{
-			HTTPPort:  httpPort,
-			Port:      nodePort,
-			Reachable: false,
-		}
+func (ds *DashboardServer) discoverCluster() ClusterStatus {
+	// Scan the whole port range concurrently; each result lands in its own
+	// slot, so the node list stays in port order without sorting
+	nodes := make([]NodeInfo, len(ds.endpoints))
+	var wg sync.WaitGroup
+	for i, ep := range ds.endpoints {
+		wg.Add(1)
+		go func(i int, ep nodeEndpoint) {
+			defer wg.Done()
+			nodes[i] = ds.scanNode(ep)
+		}(i, ep)
+	}
+	wg.Wait()
 
-		if err != nil {
-			// Node not reachable
-			nodes = append(nodes, node)
-			continue
+	activeCount := 0
+	for _, node := range nodes {
+		if node.Reachable {
+			activeCount++
 		}
-		defer resp.Body.Close()
+	}
 
-		// Parse node status
-		var status map[string]interface{}
-		if err := json.NewDecoder(resp.Body).Decode(&status); err != nil {
-			nodes = append(nodes, node)
-			continue
-		}
+	return ClusterStatus{
+		Nodes:       nodes,
+		TotalNodes:  len(nodes),
+		ActiveNodes: activeCount,
+		Timestamp:   time.Now().Format("15:04:05"),
+	}
+}
 
-		node.Reachable = true
-		node.ID = getString(status, "node_id")
-		node.Status = "healthy" // Default to healthy if reachable
-		node.Neighbors = getInt(status, "neighbor_count")
-
-		// Get computation statistics
-		compResp, err := client.Get(fmt.Sprintf("http://localhost:%d/compute", httpPort))
-		if err == nil {
-			defer compResp.Body.Close()
-			var compData map[string]interface{}
-			if json.NewDecoder(compResp.Body).Decode(&compData) == nil {
-				if stats, ok := compData["stats"].(map[string]interface{}); ok {
-					node.Tasks = getInt(stats, "active_tasks")
-					node.CompletedTasks = getInt(stats, "completed_tasks")
-				}
-			}
-		}
+// scanNode queries a single node slot and returns what it reports
+func (ds *DashboardServer) scanNode(ep nodeEndpoint) NodeInfo {
+	node := NodeInfo{
+		HTTPPort:  ep.httpPort,
+		Port:      ep.nodePort,
+		Reachable: false,
+	}
 
-		node.LastUpdate = time.Now().Format("15:04:05")
+	// Parse node status
+	var status map[string]interface{}
+	if err := ds.getJSON(ep.statusURL, &status); err != nil {
+		// Node not reachable
+		return node
+	}
 
-		// Try to get chemistry energy
-		chemResp, err := client.Get(fmt.Sprintf("http://localhost:%d/chemistry/stats", httpPort))
-		if err == nil {
-			defer chemResp.Body.Close()
-			var chemStats map[string]interface{}
-			if json.NewDecoder(chemResp.Body).Decode(&chemStats) == nil {
-				node.ChemEnergy = getFloat(chemStats, "total_energy")
-			}
+	node.Reachable = true
+	node.ID = getString(status, "node_id")
+	node.Status = "healthy" // Default to healthy if reachable
+	node.Neighbors = getInt(status, "neighbor_count")
+
+	// Get computation statistics
+	var compData map[string]interface{}
+	if ds.getJSON(ep.computeURL, &compData) == nil {
+		if stats, ok := compData["stats"].(map[string]interface{}); ok {
+			node.Tasks = getInt(stats, "active_tasks")
+			node.CompletedTasks = getInt(stats, "completed_tasks")
 		}
-
-		nodes = append(nodes, node)
-		activeCount++
 	}
 
-	// Sort nodes by port for consistent display
-	sort.Slice(nodes, func(i, j int) bool {
-		return nodes[i].HTTPPort < nodes[j].HTTPPort
-	})
+	node.LastUpdate = time.Now().Format("15:04:05")
 
-	return ClusterStatus{
-		Nodes:       nodes,
-		TotalNodes:  len(nodes),
-		ActiveNodes: activeCount,
-		Timestamp:   time.Now().Format("15:04:05"),
+	// Try to get chemistry energy
+	var chemStats map[string]interface{}
+	if ds.getJSON(ep.chemURL, &chemStats) == nil {
+		node.ChemEnergy = getFloat(chemStats, "total_energy")
 	}
+
+	return node
 }
 
 func (ds *DashboardServer) handleDashboard(w http.ResponseWriter, r *http.Request) {
@@ -167,21 +211,32 @@ func (ds *DashboardServer) handleNodeProxy(w http.ResponseWriter, r *http.Reques
 		return
 	}
 
-	// Proxy request to node
-	client := &http.Client{Timeout: 5 * time.Second}
+	// Proxy request to node over the shared client
 	targetURL := fmt.Sprintf("http://localhost:%d%s", port, apiPath)
 
-	var resp *http.Response
+	var body io.Reader
 	switch r.Method {
 	case "GET":
-		resp, err = client.Get(targetURL)
 	case "POST":
-		resp, err = client.Post(targetURL, r.Header.Get("Content-Type"), r.Body)
+		body = r.Body
 	default:
 		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
 		return
 	}
 
+	ctx, cancel := context.WithTimeout(r.Context(), proxyTimeout)
+	defer cancel()
+
+	req, err := http.NewRequestWithContext(ctx, r.Method, targetURL, body)
+	if err != nil {
+		http.Error(w, fmt.Sprintf("Invalid proxy request: %v", err), http.StatusBadRequest)
+		return
+	}
+	if body != nil {
+		req.Header.Set("Content-Type", r.Header.Get("Content-Type"))
+	}
+
+	resp, err := ds.client.Do(req)
 	if err != nil {
 		http.Error(w, fmt.Sprintf("Node request failed: %v", err), http.StatusBadGateway)
 		return
@@ -194,17 +249,25 @@ func (ds *DashboardServer) handleNodeProxy(w http.ResponseWriter, r *http.Reques
 	}
 	w.WriteHeader(resp.StatusCode)
 
-	// Stream response body
-	buf := make([]byte, 32*1024)
-	for {
-		n, err := resp.Body.Read(buf)
-		if n > 0 {
-			w.Write(buf[:n])
-		}
-		if err != nil {
-			break
-		}
-	}
+	copyResponse(w, resp.Body)
+}
+
+// copyBufPool holds the buffers used to stream proxied node responses
+var copyBufPool = sync.Pool{
+	New: func() interface{} {
+		buf := make([]byte, 32*1024)
+		return &buf
+	},
+}
+
+// copyResponse streams body to w through a pooled buffer.
+// Both sides are wrapped so io.CopyBuffer cannot hand off to ReadFrom/WriteTo:
+// net/http's ResponseWriter ends up in TCPConn.ReadFrom, which allocates its own
+// 32 KB copy buffer whenever sendfile/splice does not apply.
+func copyResponse(w io.Writer, body io.Reader) {
+	bufp := copyBufPool.Get().(*[]byte)
+	io.CopyBuffer(struct{ io.Writer }{w}, struct{ io.Reader }{body}, *bufp)
+	copyBufPool.Put(bufp)
 }
 
 func (ds *DashboardServer) handleStatic(w http.ResponseWriter, r *http.Request) {
@@ -218,9 +281,9 @@ func (ds *DashboardServer) handleClusterTaskSubmit(w http.ResponseWriter, r *htt
 		return
 	}
 
-	// Parse task submission request
-	var taskRequest map[string]interface{}
-	if err := json.NewDecoder(r.Body).Decode(&taskRequest); err != nil {
+	// Validate the task submission request; the raw bytes are forwarded as-is
+	var taskJSON json.RawMessage
+	if err := json.NewDecoder(r.Body).Decode(&taskJSON); err != nil {
 		http.Error(w, "Invalid JSON", http.StatusBadRequest)
 		return
 	}
@@ -240,16 +303,20 @@ func (ds *DashboardServer) handleClusterTaskSubmit(w http.ResponseWriter, r *htt
 		return
 	}
 
-	// Submit task to target node
-	client := &http.Client{Timeout: 5 * time.Second}
-	taskJSON, _ := json.Marshal(taskRequest)
+	// Submit task to target node over the shared client
+	ctx, cancel := context.WithTimeout(r.Context(), proxyTimeout)
+	defer cancel()
 
-	resp, err := client.Post(
+	req, err := http.NewRequestWithContext(ctx, http.MethodPost,
 		fmt.Sprintf("http://localhost:%d/compute", targetNode.HTTPPort),
-		"application/json",
-		strings.NewReader(string(taskJSON)),
-	)
+		bytes.NewReader(taskJSON))
+	if err != nil {
+		http.Error(w, fmt.Sprintf("Failed to submit task: %v", err), http.StatusInternalServerError)
+		return
+	}
+	req.Header.Set("Content-Type", "application/json")
 
+	resp, err := ds.client.Do(req)
 	if err != nil {
 		http.Error(w, fmt.Sprintf("Failed to submit task: %v", err), http.StatusBadGateway)
 		return
@@ -259,17 +326,7 @@ func (ds *DashboardServer) handleClusterTaskSubmit(w http.ResponseWriter, r *htt
 	// Return the response from the node
 	w.Header().Set("Content-Type", "application/json")
 	w.WriteHeader(resp.StatusCode)
-
-	buf := make([]byte, 32*1024)
-	for {
-		n, err := resp.Body.Read(buf)
-		if n > 0 {
-			w.Write(buf[:n])
-		}
-		if err != nil {
-			break
-		}
-	}
+	copyResponse(w, resp.Body)
 }
 
 func (ds *DashboardServer) Start() error {
@@ -3,6 +3,7 @@ package main
 import (
 	"context"
 	"flag"
+	"fmt"
 	"log"
 	"os"
 	"os/signal"
@@ -19,6 +20,8 @@ func main() {
 	httpPort := flag.Int("http-port", 8001, "HTTP API port")
 	clusterID := flag.String("cluster-id", "default", "Cluster identifier")
 	nodeID := flag.String("node-id", "", "Node identifier (auto-generated if empty)")
+	nodeCount := flag.Int("nodes", 1, "Number of nodes to host in this process (on consecutive ports)")
+	readyFD := flag.Int("ready-fd", -1, "File descriptor to write a byte to once all nodes are listening (used by ryx-cluster)")
 
 	// Phase 3C.1: Spatial configuration flags
 	coordSystem := flag.String("coord-system", "none", "Coordinate system: gps, relative, logical, none")
@@ -39,26 +42,44 @@ func main() {
 		log.Fatalf("Invalid spatial configuration: %v", err)
 	}
 
-	// Create and start the node
-	config := &node.Config{
-		Port:          *port,
-		HTTPPort:      *httpPort,
-		ClusterID:     *clusterID,
-		NodeID:        *nodeID,
-		SpatialConfig: spatialConfig,
+	if *nodeCount < 1 {
+		log.Fatalf("Invalid node count: %d", *nodeCount)
 	}
 
-	n, err := node.New(config)
-	if err != nil {
-		log.Fatalf("Failed to create node: %v", err)
-	}
+	// Create and start the nodes; node i listens on port+i and http-port+i
+	nodes := make([]*node.Node, 0, *nodeCount)
+	for i := 0; i < *nodeCount; i++ {
+		id := *nodeID
+		if id != "" && *nodeCount > 1 {
+			id = fmt.Sprintf("%s_%d", id, i)
+		}
+
+		config := &node.Config{
+			Port:          *port + i,
+			HTTPPort:      *httpPort + i,
+			ClusterID:     *clusterID,
+			NodeID:        id,
+			SpatialConfig: spatialConfig,
+		}
 
-	log.Printf("Starting ryx-node %s on UDP:%d HTTP:%d cluster:%s spatial:%s",
-		n.ID(), *port, *httpPort, *clusterID, spatialConfig.String())
+		n, err := node.New(config)
+		if err != nil {
+			stopNodes(nodes)
+			log.Fatalf("Failed to create node: %v", err)
+		}
+
+		log.Printf("Starting ryx-node %s on UDP:%d HTTP:%d cluster:%s spatial:%s",
+			n.ID(), config.Port, config.HTTPPort, *clusterID, spatialConfig.String())
+
+		if err := n.Start(ctx); err != nil {
+			stopNodes(nodes)
+			log.Fatalf("Failed to start node: %v", err)
+		}
+		nodes = append(nodes, n)
+	}
 
-	// Start the node in a goroutine
-	if err := n.Start(ctx); err != nil {
-		log.Fatalf("Failed to start node: %v", err)
+	if *readyFD >= 0 {
+		signalReady(*readyFD)
 	}
 
 	// Wait for shutdown signal
@@ -68,10 +89,31 @@ func main() {
 
 	log.Println("Shutting down...")
 	cancel()
-	n.Stop()
+	stopNodes(nodes)
 	log.Println("Shutdown complete")
 }
 
+// stopNodes stops every node hosted by this process
+func stopNodes(nodes []*node.Node) {
+	for _, n := range nodes {
+		n.Stop()
+	}
+}
+
+// signalReady tells the launching process that every node is listening
+func signalReady(fd int) {
+	f := os.NewFile(uintptr(fd), "ready")
+	if f == nil {
+		log.Printf("Warning: invalid ready file descriptor %d", fd)
+		return
+	}
+	defer f.Close()
+
+	if _, err := f.Write([]byte{1}); err != nil {
+		log.Printf("Warning: failed to signal readiness: %v", err)
+	}
+}
+
 // parseSpatialConfig creates a spatial configuration from CLI arguments
 func parseSpatialConfig(coordSystem string, x, y, z float64, barriers string) (*spatial.SpatialConfig, error) {
 	// Handle coordinate values - only set if not zero or if coord system requires them
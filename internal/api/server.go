@@ -1,14 +1,16 @@
 package api
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
 	"log"
-	"math"
+	"net"
 	"net/http"
 	"reflect"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/BasicAcid/ryx/internal/ca"
@@ -85,6 +87,41 @@ type Server struct {
 	port   int
 	node   NodeProvider
 	server *http.Server
+
+	// Encoded /info response, reused until the diffusion store changes
+	infoCache        []byte
+	infoCacheVersion uint64
+	infoCacheMu      sync.Mutex
+
+	// Encoded /health and /ping responses; they only change with the timestamp second
+	healthCache timedResponse
+	pingCache   timedResponse
+}
+
+// timedResponse caches a fixed JSON response whose only varying field is a Unix timestamp
+type timedResponse struct {
+	mu     sync.Mutex
+	second int64
+	body   []byte
+}
+
+// encoded returns the response for the given second, encoding build's result only
+// when the second has moved on since the last call
+func (t *timedResponse) encoded(now int64, build func(timestamp int64) interface{}) ([]byte, error) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	if t.body != nil && t.second == now {
+		return t.body, nil
+	}
+
+	var buf bytes.Buffer
+	if err := json.NewEncoder(&buf).Encode(build(now)); err != nil {
+		return nil, err
+	}
+	t.body = buf.Bytes()
+	t.second = now
+	return t.body, nil
 }
 
 // New creates a new API server
@@ -156,11 +193,17 @@ func (s *Server) Start(ctx context.Context) error {
 		Handler: s.enableCORS(mux),
 	}
 
+	// Bind before returning so a started node is already accepting requests
+	listener, err := net.Listen("tcp", s.server.Addr)
+	if err != nil {
+		return fmt.Errorf("failed to listen on HTTP port %d: %w", s.port, err)
+	}
+
 	log.Printf("HTTP API server starting on port %d", s.port)
 
 	// Start server in goroutine
 	go func() {
-		if err := s.server.ListenAndServe(); err != nil && err != http.ErrServerClosed {
+		if err := s.server.Serve(listener); err != nil && err != http.ErrServerClosed {
 			log.Printf("HTTP server error: %v", err)
 		}
 	}()
@@ -223,12 +266,13 @@ func (s *Server) handleHealth(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	response := map[string]interface{}{
-		"status":    "healthy",
-		"node_id":   s.node.ID(),
-		"timestamp": time.Now().Unix(),
-	}
-	s.writeJSON(w, response)
+	s.writeTimedJSON(w, &s.healthCache, func(timestamp int64) interface{} {
+		return map[string]interface{}{
+			"status":    "healthy",
+			"node_id":   s.node.ID(),
+			"timestamp": timestamp,
+		}
+	})
 }
 
 // handlePing returns simple ping response
@@ -238,12 +282,13 @@ func (s *Server) handlePing(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	response := map[string]interface{}{
-		"pong":      true,
-		"node_id":   s.node.ID(),
-		"timestamp": time.Now().Unix(),
-	}
-	s.writeJSON(w, response)
+	s.writeTimedJSON(w, &s.pingCache, func(timestamp int64) interface{} {
+		return map[string]interface{}{
+			"pong":      true,
+			"node_id":   s.node.ID(),
+			"timestamp": timestamp,
+		}
+	})
 }
 
 // handleInject handles information injection requests
@@ -278,7 +323,7 @@ func (s *Server) handleInject(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	log.Printf("handleInject: parsed request - type=%s, content=%s, energy=%d, ttl=%d",
+	log.Printf("handleInject: parsed request - type=%s, content=%s, energy=%.2f, ttl=%d",
 		request.Type, request.Content, request.Energy, request.TTL)
 
 	// Validate request
@@ -292,7 +337,7 @@ func (s *Server) handleInject(w http.ResponseWriter, r *http.Request) {
 		request.TTL = 300 // Default TTL: 5 minutes
 	}
 
-	log.Printf("handleInject: validated request - type=%s, energy=%d, ttl=%d",
+	log.Printf("handleInject: validated request - type=%s, energy=%.2f, ttl=%d",
 		request.Type, request.Energy, request.TTL)
 
 	// Check if node is nil
@@ -357,6 +402,19 @@ func (s *Server) handleInfo(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// Serve the cached encoding while the store is unchanged
+	version := diffusionService.Version()
+	s.infoCacheMu.Lock()
+	if s.infoCache != nil && s.infoCacheVersion == version {
+		cached := s.infoCache
+		s.infoCacheMu.Unlock()
+
+		w.Header().Set("Content-Type", "application/json")
+		w.Write(cached)
+		return
+	}
+	s.infoCacheMu.Unlock()
+
 	allInfo := diffusionService.GetAllInfo()
 
 	response := map[string]interface{}{
@@ -364,8 +422,21 @@ func (s *Server) handleInfo(w http.ResponseWriter, r *http.Request) {
 		"info":  allInfo,
 	}
 
+	var buf bytes.Buffer
+	if err := json.NewEncoder(&buf).Encode(response); err != nil {
+		log.Printf("Failed to encode JSON response: %v", err)
+		http.Error(w, "Internal server error", http.StatusInternalServerError)
+		return
+	}
+
+	s.infoCacheMu.Lock()
+	s.infoCache = buf.Bytes()
+	s.infoCacheVersion = version
+	s.infoCacheMu.Unlock()
+
 	log.Printf("handleInfo: returning %d info messages", len(allInfo))
-	s.writeJSON(w, response)
+	w.Header().Set("Content-Type", "application/json")
+	w.Write(buf.Bytes())
 }
 
 // handleInfoByID handles requests for specific information by ID
@@ -706,6 +777,19 @@ func (s *Server) writeJSON(w http.ResponseWriter, data interface{}) {
 	}
 }
 
+// writeTimedJSON writes a cached fixed response, re-encoding it at most once per second
+func (s *Server) writeTimedJSON(w http.ResponseWriter, cache *timedResponse, build func(timestamp int64) interface{}) {
+	body, err := cache.encoded(time.Now().Unix(), build)
+	if err != nil {
+		log.Printf("Failed to encode JSON response: %v", err)
+		http.Error(w, "Internal server error", http.StatusInternalServerError)
+		return
+	}
+
+	w.Header().Set("Content-Type", "application/json")
+	w.Write(body)
+}
+
 // handleConfig handles configuration requests (GET all params, POST to update multiple)
 func (s *Server) handleConfig(w http.ResponseWriter, r *http.Request) {
 	switch r.Method {
@@ -1730,22 +1814,6 @@ func (s *Server) handleMetricsPerformance(w http.ResponseWriter, r *http.Request
 	s.writeJSON(w, metrics)
 }
 
-// Helper function for distance calculation in spatial metrics
-func (s *Server) calculateDistance(spatialConfig interface{}, x, y, z float64) float64 {
-	// This is a simplified distance calculation for metrics
-	// In a real implementation, we'd use the proper spatial distance calculation
-	if config, ok := spatialConfig.(map[string]interface{}); ok {
-		if myX, xOk := config["x"].(float64); xOk {
-			if myY, yOk := config["y"].(float64); yOk {
-				dx := x - myX
-				dy := y - myY
-				return math.Sqrt(dx*dx + dy*dy)
-			}
-		}
-	}
-	return 0
-}
-
 // handleUnifiedMetrics provides both Prometheus and JSON metrics via format detection
 // Phase 4B-Alt: Unified metrics endpoint with smart format detection
 func (s *Server) handleUnifiedMetrics(w http.ResponseWriter, r *http.Request) {
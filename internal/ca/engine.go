@@ -14,6 +14,9 @@ const (
 	Alive CellState = 1
 )
 
+// updateHistorySize is the number of recent updates kept for rate calculation
+const updateHistorySize = 10
+
 // BoundaryStates represents the edge states shared between neighboring CA grids
 type BoundaryStates struct {
 	// Edge arrays for 4 directions: North, South, East, West
@@ -41,6 +44,7 @@ type Grid struct {
 	Height     int          `json:"height"`
 	Cells      [][]Cell     `json:"cells"`
 	Generation int          `json:"generation"`
+	liveCells  int          // Running count of Alive cells, maintained on every state change
 	mu         sync.RWMutex `json:"-"` // Exclude mutex from JSON serialization
 }
 
@@ -54,12 +58,15 @@ type Engine struct {
 	mu            sync.RWMutex
 	lastUpdate    time.Time
 	totalUpdates  int64
-	updateHistory []time.Time // For calculating updates per second
+	updateHistory [updateHistorySize]time.Time // Ring buffer for calculating updates per second
+	historyNext   int                          // Next ring buffer slot to write
+	historyCount  int                          // Number of valid entries in the ring buffer
 
 	// Phase 3: CA Grid Connectivity
 	neighborBoundaries map[string]*BoundaryStates // Remote boundary states by node ID
 	boundaryMu         sync.RWMutex               // Separate mutex for boundary state access
 	boundaryCallback   func(*BoundaryStates)      // Callback to broadcast boundary states
+	boundaryNotify     chan struct{}              // Wakes the boundary broadcaster (latest generation wins)
 
 	// Cached boundary snapshots to avoid locking during neighbor counting
 	cachedBoundaries map[string]*BoundaryStates // Cached copy for safe reading
@@ -71,14 +78,14 @@ func NewEngine(nodeID string, width, height int) *Engine {
 	log.Printf("CA[%s]: Creating new cellular automata engine (%dx%d)", nodeID, width, height)
 
 	engine := &Engine{
-		nodeID:        nodeID,
-		updateRate:    time.Second, // 1 generation per second by default
-		stopChan:      make(chan bool),
-		updateHistory: make([]time.Time, 0, 10), // Keep last 10 updates for rate calculation
+		nodeID:     nodeID,
+		updateRate: time.Second, // 1 generation per second by default
+		stopChan:   make(chan bool),
 
 		// Phase 3: Initialize boundary exchange
 		neighborBoundaries: make(map[string]*BoundaryStates),
 		cachedBoundaries:   make(map[string]*BoundaryStates),
+		boundaryNotify:     make(chan struct{}, 1),
 	}
 
 	engine.grid = engine.createGrid(width, height)
@@ -148,6 +155,11 @@ func (e *Engine) updateLoop() {
 	ticker := time.NewTicker(e.updateRate)
 	defer ticker.Stop()
 
+	// The boundary broadcaster lives exactly as long as the update loop
+	done := make(chan struct{})
+	defer close(done)
+	go e.boundaryLoop(done)
+
 	for {
 		select {
 		case <-ticker.C:
@@ -182,26 +194,27 @@ func (e *Engine) updateGeneration() {
 		}
 	}
 
-	// Apply next states to current states (synchronous update)
+	// Apply next states to current states (synchronous update), counting live cells as we go
+	liveCells := 0
 	for y := 0; y < e.grid.Height; y++ {
 		for x := 0; x < e.grid.Width; x++ {
 			e.grid.Cells[y][x].State = e.grid.Cells[y][x].NextState
+			if e.grid.Cells[y][x].State == Alive {
+				liveCells++
+			}
 		}
 	}
+	e.grid.liveCells = liveCells
 
 	// Update generation counter and statistics
 	e.grid.Generation++
 	e.updateStats()
 
-	// Phase 3: Broadcast boundary states asynchronously to avoid blocking CA updates
-	if e.boundaryCallback != nil {
-		// Create boundary states outside of any locks to avoid deadlock
-		go func() {
-			boundaries := e.GetBoundaryStates()
-			if boundaries != nil {
-				e.boundaryCallback(boundaries)
-			}
-		}()
+	// Phase 3: Wake the boundary broadcaster without blocking CA updates.
+	// If a broadcast is already pending it will pick up this generation.
+	select {
+	case e.boundaryNotify <- struct{}{}:
+	default:
 	}
 
 	if e.grid.Generation%10 == 0 {
@@ -209,8 +222,36 @@ func (e *Engine) updateGeneration() {
 	}
 }
 
+// boundaryLoop broadcasts boundary states after each generation until done is closed.
+// Generations that complete while a broadcast is in flight are coalesced into one.
+func (e *Engine) boundaryLoop(done <-chan struct{}) {
+	for {
+		select {
+		case <-done:
+			return
+		case <-e.boundaryNotify:
+			e.mu.RLock()
+			callback := e.boundaryCallback
+			e.mu.RUnlock()
+			if callback == nil {
+				continue
+			}
+
+			// Snapshot boundaries outside the grid update lock to avoid deadlock
+			if boundaries := e.GetBoundaryStates(); boundaries != nil {
+				callback(boundaries)
+			}
+		}
+	}
+}
+
 // countLiveNeighbors counts living neighbors using boundary exchange with connected CA grids
 func (e *Engine) countLiveNeighbors(x, y int) int {
+	// Interior cells (the vast majority) never touch the boundary logic
+	if x > 0 && y > 0 && x < e.grid.Width-1 && y < e.grid.Height-1 {
+		return countInteriorNeighbors(e.grid.Cells, x, y)
+	}
+
 	count := 0
 
 	// Check all 8 neighbors
@@ -241,6 +282,38 @@ func (e *Engine) countLiveNeighbors(x, y int) int {
 	return count
 }
 
+// countInteriorNeighbors counts live neighbors of a cell that is not on the grid edge.
+// The 8 neighbors are unrolled with no per-neighbor bounds or boundary checks.
+func countInteriorNeighbors(cells [][]Cell, x, y int) int {
+	up, row, down := cells[y-1], cells[y], cells[y+1]
+	count := 0
+	if up[x-1].State == Alive {
+		count++
+	}
+	if up[x].State == Alive {
+		count++
+	}
+	if up[x+1].State == Alive {
+		count++
+	}
+	if row[x-1].State == Alive {
+		count++
+	}
+	if row[x+1].State == Alive {
+		count++
+	}
+	if down[x-1].State == Alive {
+		count++
+	}
+	if down[x].State == Alive {
+		count++
+	}
+	if down[x+1].State == Alive {
+		count++
+	}
+	return count
+}
+
 // getBoundaryNeighborState gets the state of a boundary neighbor from connected grids
 func (e *Engine) getBoundaryNeighborState(x, y, dx, dy int) CellState {
 	// Use cached boundaries to avoid locking conflicts with update loop
@@ -299,13 +372,18 @@ func (e *Engine) getBoundaryNeighborState(x, y, dx, dy int) CellState {
 // updateStats updates performance statistics
 func (e *Engine) updateStats() {
 	now := time.Now()
+
+	e.mu.Lock()
+	defer e.mu.Unlock()
+
 	e.lastUpdate = now
 	e.totalUpdates++
 
-	// Keep sliding window of update times
-	e.updateHistory = append(e.updateHistory, now)
-	if len(e.updateHistory) > 10 {
-		e.updateHistory = e.updateHistory[1:]
+	// Keep sliding window of update times without reallocating
+	e.updateHistory[e.historyNext] = now
+	e.historyNext = (e.historyNext + 1) % updateHistorySize
+	if e.historyCount < updateHistorySize {
+		e.historyCount++
 	}
 }
 
@@ -318,7 +396,14 @@ func (e *Engine) SetCell(x, y int, state CellState) error {
 		return nil // Ignore out-of-bounds
 	}
 
-	e.grid.Cells[y][x].State = state
+	cell := &e.grid.Cells[y][x]
+	if cell.State == Alive {
+		e.grid.liveCells--
+	}
+	if state == Alive {
+		e.grid.liveCells++
+	}
+	cell.State = state
 	return nil
 }
 
@@ -336,6 +421,7 @@ func (e *Engine) GetGrid() *Grid {
 		Width:      e.grid.Width,
 		Height:     e.grid.Height,
 		Generation: e.grid.Generation,
+		liveCells:  e.grid.liveCells,
 		Cells:      make([][]Cell, e.grid.Height),
 	}
 
@@ -360,13 +446,7 @@ func (e *Engine) GetStats() map[string]interface{} {
 		generation = e.grid.Generation
 		width = e.grid.Width
 		height = e.grid.Height
-		for y := 0; y < e.grid.Height; y++ {
-			for x := 0; x < e.grid.Width; x++ {
-				if e.grid.Cells[y][x].State == Alive {
-					liveCells++
-				}
-			}
-		}
+		liveCells = e.grid.liveCells
 		e.grid.mu.RUnlock()
 	}
 
@@ -379,10 +459,12 @@ func (e *Engine) GetStats() map[string]interface{} {
 
 	// Calculate updates per second
 	var updatesPerSecond float64
-	if len(e.updateHistory) > 1 {
-		duration := e.updateHistory[len(e.updateHistory)-1].Sub(e.updateHistory[0])
+	if e.historyCount > 1 {
+		newest := e.updateHistory[(e.historyNext+updateHistorySize-1)%updateHistorySize]
+		oldest := e.updateHistory[(e.historyNext+updateHistorySize-e.historyCount)%updateHistorySize]
+		duration := newest.Sub(oldest)
 		if duration > 0 {
-			updatesPerSecond = float64(len(e.updateHistory)-1) / duration.Seconds()
+			updatesPerSecond = float64(e.historyCount-1) / duration.Seconds()
 		}
 	}
 	e.mu.RUnlock()
@@ -444,6 +526,16 @@ func (e *Engine) InitializePattern(pattern string) {
 		}
 	}
 
+	// Patterns write cells directly, so recount once afterwards
+	e.grid.liveCells = 0
+	for y := 0; y < e.grid.Height; y++ {
+		for x := 0; x < e.grid.Width; x++ {
+			if e.grid.Cells[y][x].State == Alive {
+				e.grid.liveCells++
+			}
+		}
+	}
+
 	log.Printf("CA[%s]: Initialized with pattern '%s'", e.nodeID, pattern)
 }
 
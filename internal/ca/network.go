@@ -3,7 +3,6 @@ package ca
 import (
 	"encoding/json"
 	"log"
-	"math"
 	"sync"
 	"time"
 
@@ -29,6 +28,9 @@ type NetworkManager struct {
 	// Update tracking
 	lastBoundaryUpdate map[string]int // nodeID -> last generation received
 	updateMu           sync.RWMutex
+
+	// Lifecycle
+	stopChan chan bool
 }
 
 // GridConnection represents a connection to another CA grid
@@ -51,6 +53,7 @@ func NewNetworkManager(nodeID string, engine *Engine, discovery *discovery.Servi
 		spatial:            spatialConfig,
 		connectedGrids:     make(map[string]*GridConnection),
 		lastBoundaryUpdate: make(map[string]int),
+		stopChan:           make(chan bool),
 	}
 
 	// Set boundary callback in CA engine
@@ -70,11 +73,8 @@ func (nm *NetworkManager) SetCommunicationService(comm types.CommunicationServic
 func (nm *NetworkManager) Start() {
 	log.Printf("CA Network[%s]: Starting CA grid network manager", nm.nodeID)
 
-	// Start periodic neighbor discovery for CA connections
-	go nm.discoverCANeighbors()
-
-	// Start periodic cleanup of stale connections
-	go nm.cleanupStaleConnections()
+	// Start periodic neighbor discovery and stale connection cleanup
+	go nm.maintenanceLoop()
 }
 
 // Stop shuts down CA network operations
@@ -84,6 +84,13 @@ func (nm *NetworkManager) Stop() {
 	nm.mu.Lock()
 	defer nm.mu.Unlock()
 
+	// Stop the maintenance loop (Stop may be called more than once)
+	select {
+	case <-nm.stopChan:
+	default:
+		close(nm.stopChan)
+	}
+
 	// Clear all connections
 	nm.connectedGrids = make(map[string]*GridConnection)
 	nm.lastBoundaryUpdate = make(map[string]int)
@@ -127,21 +134,27 @@ func (nm *NetworkManager) broadcastBoundaryStates(boundaries *BoundaryStates) {
 		Timestamp: time.Now().Unix(),
 	}
 
-	// Send to connected neighbors
-	sent := 0
+	// Send to all connected neighbors in one batch
+	targets := make([]*types.Neighbor, 0, len(nm.connectedGrids))
 	for _, conn := range nm.connectedGrids {
-		err := nm.commService.SendInfoMessage(conn.NodeID, conn.Address, conn.Port, infoMsg)
-		if err != nil {
-			log.Printf("CA Network[%s]: Failed to send boundary to %s: %v", nm.nodeID, conn.NodeID, err)
-		} else {
-			sent++
-		}
+		targets = append(targets, &types.Neighbor{
+			NodeID:  conn.NodeID,
+			Address: conn.Address,
+			Port:    conn.Port,
+		})
 	}
 
-	if sent > 0 {
-		log.Printf("CA Network[%s]: Broadcast boundary states (gen %d) to %d connected grids",
-			nm.nodeID, boundaries.Generation, sent)
+	if len(targets) == 0 {
+		return
 	}
+
+	if err := nm.commService.SendInfoMessageBatch(targets, infoMsg); err != nil {
+		log.Printf("CA Network[%s]: Failed to broadcast boundary states: %v", nm.nodeID, err)
+		return
+	}
+
+	log.Printf("CA Network[%s]: Broadcast boundary states (gen %d) to %d connected grids",
+		nm.nodeID, boundaries.Generation, len(targets))
 }
 
 // HandleBoundaryMessage processes incoming boundary state messages
@@ -193,15 +206,22 @@ func (nm *NetworkManager) HandleBoundaryMessage(msg *types.InfoMessage, fromNode
 		nm.nodeID, fromNodeID, boundaryMsg.Generation)
 }
 
-// discoverCANeighbors periodically discovers and connects to nearby CA grids
-func (nm *NetworkManager) discoverCANeighbors() {
-	ticker := time.NewTicker(10 * time.Second) // Check every 10 seconds
-	defer ticker.Stop()
+// maintenanceLoop periodically discovers nearby CA grids and removes stale
+// connections from a single goroutine until Stop is called
+func (nm *NetworkManager) maintenanceLoop() {
+	discoverTicker := time.NewTicker(10 * time.Second) // Check every 10 seconds
+	defer discoverTicker.Stop()
+	cleanupTicker := time.NewTicker(30 * time.Second) // Check every 30 seconds
+	defer cleanupTicker.Stop()
 
 	for {
 		select {
-		case <-ticker.C:
+		case <-nm.stopChan:
+			return
+		case <-discoverTicker.C:
 			nm.updateCAConnections()
+		case <-cleanupTicker.C:
+			nm.cleanupStaleConnections()
 		}
 	}
 }
@@ -290,23 +310,15 @@ func (nm *NetworkManager) calculateDirection(neighbor *discovery.Neighbor) strin
 
 // cleanupStaleConnections removes connections that haven't been updated recently
 func (nm *NetworkManager) cleanupStaleConnections() {
-	ticker := time.NewTicker(30 * time.Second) // Check every 30 seconds
-	defer ticker.Stop()
+	nm.mu.Lock()
+	defer nm.mu.Unlock()
 
-	for {
-		select {
-		case <-ticker.C:
-			nm.mu.Lock()
-			staleTimeout := time.Now().Add(-60 * time.Second) // 60 second timeout
-
-			for nodeID, conn := range nm.connectedGrids {
-				if conn.LastUpdate.Before(staleTimeout) {
-					delete(nm.connectedGrids, nodeID)
-					nm.caEngine.RemoveNeighborBoundary(nodeID)
-					log.Printf("CA Network[%s]: Removed stale connection to %s", nm.nodeID, nodeID)
-				}
-			}
-			nm.mu.Unlock()
+	staleTimeout := time.Now().Add(-60 * time.Second) // 60 second timeout
+	for nodeID, conn := range nm.connectedGrids {
+		if conn.LastUpdate.Before(staleTimeout) {
+			delete(nm.connectedGrids, nodeID)
+			nm.caEngine.RemoveNeighborBoundary(nodeID)
+			log.Printf("CA Network[%s]: Removed stale connection to %s", nm.nodeID, nodeID)
 		}
 	}
 }
@@ -355,10 +367,6 @@ func intToCellStates(ints []int) []CellState {
 	return result
 }
 
-func isInfiniteDistance(distance *spatial.Distance) bool {
-	return math.IsInf(distance.Value, 1) || distance.Value < 0 // Check for infinite or invalid distance
-}
-
 func simpleStringHash(s string) int {
 	hash := 0
 	for _, c := range s {
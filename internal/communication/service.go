@@ -1,8 +1,10 @@
 package communication
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"log"
 	"net"
@@ -10,18 +12,63 @@ import (
 	"time"
 
 	"github.com/BasicAcid/ryx/internal/config"
+	"github.com/BasicAcid/ryx/internal/transport"
 	"github.com/BasicAcid/ryx/internal/types"
 )
 
-// Message represents a communication message between nodes
+// Message represents a communication message between nodes.
+// Data holds a typed payload (pingData, infoData) that is encoded without a map intermediate.
 type Message struct {
+	Type      string      `json:"type"`
+	From      string      `json:"from"`
+	To        string      `json:"to"`
+	Data      interface{} `json:"data"`
+	Energy    float64     `json:"energy"`
+	Hops      int         `json:"hops"`
+	Timestamp int64       `json:"timestamp"`
+}
+
+// inboundMessage is the receive-side view of a Message; Data is decoded lazily
+// into a typed payload once the message type is known
+type inboundMessage struct {
+	Type      string          `json:"type"`
+	From      string          `json:"from"`
+	To        string          `json:"to"`
+	Data      json.RawMessage `json:"data"`
+	Energy    float64         `json:"energy"`
+	Hops      int             `json:"hops"`
+	Timestamp int64           `json:"timestamp"`
+}
+
+// pingData is the payload of ping and pong messages
+type pingData struct {
+	Timestamp     int64 `json:"timestamp"`
+	PingTimestamp int64 `json:"ping_timestamp,omitempty"`
+}
+
+// infoData is the wire layout of an InfoMessage carried in Message.Data
+type infoData struct {
+	ID        string                 `json:"id"`
 	Type      string                 `json:"type"`
-	From      string                 `json:"from"`
-	To        string                 `json:"to"`
-	Data      map[string]interface{} `json:"data"`
-	Energy    float64                `json:"energy"`
-	Hops      int                    `json:"hops"`
+	Content   string                 `json:"content"`
+	TTL       int64                  `json:"ttl"`
+	Source    string                 `json:"source"`
+	Path      []string               `json:"path"`
 	Timestamp int64                  `json:"timestamp"`
+	Metadata  map[string]interface{} `json:"metadata"`
+}
+
+// inboundInfoData is the receive-side view of infoData. Pointer fields let
+// convertToInfoMessage tell a missing (or null) field from an empty one.
+type inboundInfoData struct {
+	ID        *string         `json:"id"`
+	Type      *string         `json:"type"`
+	Content   *string         `json:"content"`
+	TTL       *float64        `json:"ttl"`
+	Source    *string         `json:"source"`
+	Path      []string        `json:"path"`
+	Timestamp *float64        `json:"timestamp"`
+	Metadata  json.RawMessage `json:"metadata"`
 }
 
 // Service handles inter-node communication
@@ -39,8 +86,14 @@ type Service struct {
 
 	// Phase 3: CA message handling
 	caMessageHandler types.InfoMessageHandler
+
+	// Reusable encode buffers for outbound datagrams
+	encodePool sync.Pool
 }
 
+// maxPooledBufferSize keeps unusually large encode buffers from being pinned by the pool
+const maxPooledBufferSize = 64 * 1024
+
 // New creates a new communication service
 func New(port int, nodeID string) (*Service, error) {
 	return &Service{
@@ -73,6 +126,10 @@ func (s *Service) Start(ctx context.Context) error {
 		return fmt.Errorf("failed to listen on UDP port %d: %w", s.port, err)
 	}
 
+	if err := transport.ConfigureBuffers(s.conn, transport.DefaultReadBuffer, transport.DefaultWriteBuffer); err != nil {
+		log.Printf("Warning: failed to configure UDP buffers on port %d: %v", s.port, err)
+	}
+
 	log.Printf("Communication service listening on port %d", s.port)
 
 	// Start message handling loop
@@ -93,14 +150,29 @@ func (s *Service) Stop() {
 
 // SendMessage sends a message to a specific node
 func (s *Service) SendMessage(address string, port int, message *Message) error {
-	data, err := json.Marshal(message)
+	addr, err := net.ResolveUDPAddr("udp", fmt.Sprintf("%s:%d", address, port))
 	if err != nil {
-		return fmt.Errorf("failed to marshal message: %w", err)
+		return fmt.Errorf("failed to resolve target address: %w", err)
 	}
 
-	addr, err := net.ResolveUDPAddr("udp", fmt.Sprintf("%s:%d", address, port))
+	return s.sendTo(addr, message)
+}
+
+// sendTo encodes message and sends it to an already resolved address
+func (s *Service) sendTo(addr *net.UDPAddr, message *Message) error {
+	buf, err := s.encodeMessage(message)
 	if err != nil {
-		return fmt.Errorf("failed to resolve target address: %w", err)
+		return fmt.Errorf("failed to marshal message: %w", err)
+	}
+	defer s.releaseBuffer(buf)
+	data := buf.Bytes()
+
+	// Reuse the bound listen socket rather than dialing a new one per message
+	if s.conn != nil {
+		if _, err := s.conn.WriteToUDP(data, addr); err != nil {
+			return fmt.Errorf("failed to send message: %w", err)
+		}
+		return nil
 	}
 
 	conn, err := net.DialUDP("udp", nil, addr)
@@ -122,7 +194,7 @@ func (s *Service) SendPing(address string, port int) error {
 	message := &Message{
 		Type:      "ping",
 		From:      s.nodeID,
-		Data:      map[string]interface{}{"timestamp": time.Now().Unix()},
+		Data:      &pingData{Timestamp: time.Now().Unix()},
 		Timestamp: time.Now().Unix(),
 	}
 
@@ -157,50 +229,159 @@ func (s *Service) SendInfoMessage(nodeID, address string, port int, infoMsg *typ
 	}
 
 	err := s.SendMessage(address, port, msg)
+	s.recordSendResult(nodeID, infoMsg.Type, time.Since(startTime), err)
+
+	return err
+}
+
+// SendInfoMessageBatch sends an InfoMessage to several nodes, flushing all datagrams
+// through the listening socket in as few syscalls as the platform allows
+func (s *Service) SendInfoMessageBatch(targets []*types.Neighbor, infoMsg *types.InfoMessage) error {
+	if len(targets) == 0 {
+		return nil
+	}
+
+	// Without a bound socket there is nothing to batch on, send individually
+	if s.conn == nil {
+		var firstErr error
+		for _, target := range targets {
+			err := s.SendInfoMessage(target.NodeID, target.Address, target.Port, infoMsg)
+			if err != nil && firstErr == nil {
+				firstErr = err
+			}
+		}
+		return firstErr
+	}
+
+	startTime := time.Now()
+
+	// Every target receives identical bytes, so encode the broadcast once.
+	// To is left empty: receivers address replies by From, never by To.
+	buf, err := s.encodeMessage(&Message{
+		Type:      "info",
+		From:      s.nodeID,
+		Data:      s.convertInfoMessageToData(infoMsg),
+		Energy:    infoMsg.Energy,
+		Hops:      infoMsg.Hops,
+		Timestamp: time.Now().Unix(),
+	})
+	if err != nil {
+		err = fmt.Errorf("failed to marshal message: %w", err)
+		for _, target := range targets {
+			s.recordSendResult(target.NodeID, infoMsg.Type, time.Since(startTime), err)
+		}
+		return err
+	}
+	defer s.releaseBuffer(buf)
+	payload := buf.Bytes()
+
+	packets := make([]transport.Packet, 0, len(targets))
+	queued := make([]*types.Neighbor, 0, len(targets))
+	var firstErr error
+
+	for _, target := range targets {
+		addr, err := net.ResolveUDPAddr("udp", fmt.Sprintf("%s:%d", target.Address, target.Port))
+		if err != nil {
+			err = fmt.Errorf("failed to resolve target address: %w", err)
+			s.recordSendResult(target.NodeID, infoMsg.Type, time.Since(startTime), err)
+			if firstErr == nil {
+				firstErr = err
+			}
+			continue
+		}
+
+		packets = append(packets, transport.Packet{Data: payload, Addr: addr})
+		queued = append(queued, target)
+	}
+
+	// Addresses the socket cannot reach are rejected per packet by WriteBatch,
+	// so each target gets its own result just like a resolve failure above
+	transport.WriteBatch(s.conn, packets)
 	latency := time.Since(startTime)
 
-	// Phase 3B: Record performance metrics for adaptive behavior
-	if s.behaviorMod != nil {
-		if adaptiveMod, ok := s.behaviorMod.(*config.AdaptiveBehaviorModifier); ok {
-			if err != nil {
-				// Record failure
-				adaptiveMod.RecordCommunicationFailure(nodeID, infoMsg.Type, err.Error())
-				adaptiveMod.RecordNeighborPerformance(nodeID, latency, false)
-			} else {
-				// Record success
-				adaptiveMod.RecordCommunicationSuccess(nodeID)
-				adaptiveMod.RecordNeighborPerformance(nodeID, latency, true)
+	for i, target := range queued {
+		err := packets[i].Err
+		if err != nil {
+			err = fmt.Errorf("failed to send message: %w", err)
+			if firstErr == nil {
+				firstErr = err
 			}
 		}
+		s.recordSendResult(target.NodeID, infoMsg.Type, latency, err)
 	}
 
-	return err
+	return firstErr
+}
+
+// encodeMessage encodes message into a pooled buffer.
+// The buffer must be handed back with releaseBuffer once the datagram has been sent.
+func (s *Service) encodeMessage(message *Message) (*bytes.Buffer, error) {
+	buf, _ := s.encodePool.Get().(*bytes.Buffer)
+	if buf == nil {
+		buf = new(bytes.Buffer)
+	}
+	buf.Reset()
+
+	if err := json.NewEncoder(buf).Encode(message); err != nil {
+		s.releaseBuffer(buf)
+		return nil, err
+	}
+	return buf, nil
+}
+
+// releaseBuffer returns an encode buffer to the pool
+func (s *Service) releaseBuffer(buf *bytes.Buffer) {
+	if buf.Cap() > maxPooledBufferSize {
+		return
+	}
+	s.encodePool.Put(buf)
+}
+
+// recordSendResult feeds send outcomes into the adaptive behavior modifier (Phase 3B)
+func (s *Service) recordSendResult(nodeID, msgType string, latency time.Duration, err error) {
+	if s.behaviorMod == nil {
+		return
+	}
+
+	if adaptiveMod, ok := s.behaviorMod.(*config.AdaptiveBehaviorModifier); ok {
+		if err != nil {
+			// Record failure
+			adaptiveMod.RecordCommunicationFailure(nodeID, msgType, err.Error())
+			adaptiveMod.RecordNeighborPerformance(nodeID, latency, false)
+		} else {
+			// Record success
+			adaptiveMod.RecordCommunicationSuccess(nodeID)
+			adaptiveMod.RecordNeighborPerformance(nodeID, latency, true)
+		}
+	}
 }
 
 // messageLoop handles incoming messages
 func (s *Service) messageLoop() {
-	buffer := make([]byte, 4096)
+	// Drain up to 32 queued datagrams per read
+	reader := transport.NewBatchReader(s.conn, 32, 4096)
 
+	// Block until data arrives; Stop closes the socket to wake us up
 	for {
-		select {
-		case <-s.ctx.Done():
-			return
-		default:
-			s.conn.SetReadDeadline(time.Now().Add(1 * time.Second))
-			n, addr, err := s.conn.ReadFromUDP(buffer)
-			if err != nil {
-				// Timeout is expected, continue
-				continue
+		n, err := reader.Read()
+		if err != nil {
+			if s.ctx.Err() != nil || errors.Is(err, net.ErrClosed) {
+				return
 			}
+			log.Printf("Warning: message read failed: %v", err)
+			continue
+		}
 
-			s.handleMessage(buffer[:n], addr)
+		for i := 0; i < n; i++ {
+			data, addr := reader.Packet(i)
+			s.handleMessage(data, addr)
 		}
 	}
 }
 
 // handleMessage processes incoming messages
 func (s *Service) handleMessage(data []byte, addr *net.UDPAddr) {
-	var msg Message
+	var msg inboundMessage
 	if err := json.Unmarshal(data, &msg); err != nil {
 		log.Printf("Failed to unmarshal message from %s: %v", addr, err)
 		return
@@ -228,35 +409,44 @@ func (s *Service) handleMessage(data []byte, addr *net.UDPAddr) {
 }
 
 // handlePing responds to ping messages
-func (s *Service) handlePing(msg *Message, addr *net.UDPAddr) {
+func (s *Service) handlePing(msg *inboundMessage, addr *net.UDPAddr) {
+	var ping pingData
+	if len(msg.Data) > 0 {
+		if err := json.Unmarshal(msg.Data, &ping); err != nil {
+			log.Printf("Failed to decode ping from %s: %v", msg.From, err)
+			return
+		}
+	}
+
 	response := &Message{
 		Type: "pong",
 		From: s.nodeID,
 		To:   msg.From,
-		Data: map[string]interface{}{
-			"timestamp":      time.Now().Unix(),
-			"ping_timestamp": msg.Data["timestamp"],
+		Data: &pingData{
+			Timestamp:     time.Now().Unix(),
+			PingTimestamp: ping.Timestamp,
 		},
 		Timestamp: time.Now().Unix(),
 	}
 
-	// Send response back
-	if err := s.SendMessage(addr.IP.String(), s.port, response); err != nil {
+	// Reply to the socket the ping came from; nodes send from their shared listen socket
+	if err := s.sendTo(addr, response); err != nil {
 		log.Printf("Failed to send pong to %s: %v", msg.From, err)
 	}
 }
 
 // handlePong processes ping responses
-func (s *Service) handlePong(msg *Message, addr *net.UDPAddr) {
+func (s *Service) handlePong(msg *inboundMessage, addr *net.UDPAddr) {
 	// Calculate round-trip time if we have the original timestamp
-	if pingTime, ok := msg.Data["ping_timestamp"].(float64); ok {
-		rtt := time.Now().Unix() - int64(pingTime)
+	var pong pingData
+	if err := json.Unmarshal(msg.Data, &pong); err == nil && pong.PingTimestamp != 0 {
+		rtt := time.Now().Unix() - pong.PingTimestamp
 		log.Printf("Pong from %s, RTT: %d seconds", msg.From, rtt)
 	}
 }
 
 // handleInfo processes information messages and routes them to the diffusion service
-func (s *Service) handleInfo(msg *Message, addr *net.UDPAddr) {
+func (s *Service) handleInfo(msg *inboundMessage, addr *net.UDPAddr) {
 	log.Printf("Received info message from %s", msg.From)
 
 	if s.diffusionService == nil {
@@ -279,7 +469,7 @@ func (s *Service) handleInfo(msg *Message, addr *net.UDPAddr) {
 }
 
 // handleCABoundary processes CA boundary messages
-func (s *Service) handleCABoundary(msg *Message, addr *net.UDPAddr) {
+func (s *Service) handleCABoundary(msg *inboundMessage, addr *net.UDPAddr) {
 	log.Printf("Received CA boundary message from %s", msg.From)
 
 	s.mu.RLock()
@@ -305,87 +495,69 @@ func (s *Service) handleCABoundary(msg *Message, addr *net.UDPAddr) {
 	}
 }
 
-// convertToInfoMessage converts a communication Message to an InfoMessage
-func (s *Service) convertToInfoMessage(msg *Message) (*types.InfoMessage, error) {
-	data := msg.Data
+// convertToInfoMessage converts a received message to an InfoMessage
+func (s *Service) convertToInfoMessage(msg *inboundMessage) (*types.InfoMessage, error) {
+	var data inboundInfoData
+	if err := json.Unmarshal(msg.Data, &data); err != nil {
+		return nil, fmt.Errorf("invalid info payload: %w", err)
+	}
 
-	// Extract required fields from the message data
-	id, ok := data["id"].(string)
-	if !ok {
+	// Validate required fields
+	if data.ID == nil {
 		return nil, fmt.Errorf("missing or invalid id field")
 	}
-
-	infoType, ok := data["type"].(string)
-	if !ok {
+	if data.Type == nil {
 		return nil, fmt.Errorf("missing or invalid type field")
 	}
-
-	contentStr, ok := data["content"].(string)
-	if !ok {
+	if data.Content == nil {
 		return nil, fmt.Errorf("missing or invalid content field")
 	}
-	content := []byte(contentStr)
-
-	ttl, ok := data["ttl"].(float64)
-	if !ok {
+	if data.TTL == nil {
 		return nil, fmt.Errorf("missing or invalid ttl field")
 	}
-
-	source, ok := data["source"].(string)
-	if !ok {
+	if data.Source == nil {
 		return nil, fmt.Errorf("missing or invalid source field")
 	}
-
-	timestamp, ok := data["timestamp"].(float64)
-	if !ok {
+	if data.Timestamp == nil {
 		return nil, fmt.Errorf("missing or invalid timestamp field")
 	}
-
-	// Extract path
-	pathInterface, ok := data["path"].([]interface{})
-	if !ok {
+	if data.Path == nil {
 		return nil, fmt.Errorf("missing or invalid path field")
 	}
 
-	path := make([]string, len(pathInterface))
-	for i, p := range pathInterface {
-		pathStr, ok := p.(string)
-		if !ok {
-			return nil, fmt.Errorf("invalid path element")
-		}
-		path[i] = pathStr
+	// Metadata is optional; anything other than an object is ignored
+	var metadata map[string]interface{}
+	if len(data.Metadata) > 0 {
+		json.Unmarshal(data.Metadata, &metadata)
 	}
-
-	// Extract metadata
-	metadata := make(map[string]interface{})
-	if metaInterface, ok := data["metadata"].(map[string]interface{}); ok {
-		metadata = metaInterface
+	if metadata == nil {
+		metadata = make(map[string]interface{})
 	}
 
 	return &types.InfoMessage{
-		ID:        id,
-		Type:      infoType,
-		Content:   content,
+		ID:        *data.ID,
+		Type:      *data.Type,
+		Content:   []byte(*data.Content),
 		Energy:    msg.Energy,
-		TTL:       int64(ttl),
+		TTL:       int64(*data.TTL),
 		Hops:      msg.Hops,
-		Source:    source,
-		Path:      path,
-		Timestamp: int64(timestamp),
+		Source:    *data.Source,
+		Path:      data.Path,
+		Timestamp: int64(*data.Timestamp),
 		Metadata:  metadata,
 	}, nil
 }
 
-// convertInfoMessageToData converts an InfoMessage to map[string]interface{} for transmission
-func (s *Service) convertInfoMessageToData(infoMsg *types.InfoMessage) map[string]interface{} {
-	return map[string]interface{}{
-		"id":        infoMsg.ID,
-		"type":      infoMsg.Type,
-		"content":   string(infoMsg.Content),
-		"ttl":       infoMsg.TTL,
-		"source":    infoMsg.Source,
-		"path":      infoMsg.Path,
-		"timestamp": infoMsg.Timestamp,
-		"metadata":  infoMsg.Metadata,
+// convertInfoMessageToData converts an InfoMessage to its typed wire payload for transmission
+func (s *Service) convertInfoMessageToData(infoMsg *types.InfoMessage) *infoData {
+	return &infoData{
+		ID:        infoMsg.ID,
+		Type:      infoMsg.Type,
+		Content:   string(infoMsg.Content),
+		TTL:       infoMsg.TTL,
+		Source:    infoMsg.Source,
+		Path:      infoMsg.Path,
+		Timestamp: infoMsg.Timestamp,
+		Metadata:  infoMsg.Metadata,
 	}
 }
@@ -18,6 +18,7 @@ import (
 type Service struct {
 	nodeID      string
 	storage     map[string]*types.InfoMessage
+	version     uint64 // Incremented on every storage change, guarded by mu
 	mu          sync.RWMutex
 	ctx         context.Context
 	cancel      context.CancelFunc
@@ -121,6 +122,7 @@ func (s *Service) InjectInfo(infoType string, content []byte, energy float64, tt
 	// Store locally
 	s.mu.Lock()
 	s.storage[id] = info
+	s.version++
 	s.mu.Unlock()
 
 	log.Printf("Information injected successfully: id=%s", id)
@@ -136,7 +138,7 @@ func (s *Service) InjectInfo(infoType string, content []byte, energy float64, tt
 
 	// Forward to neighbors if energy > 0 (Phase 2B inter-node diffusion)
 	if info.Energy > 0 {
-		log.Printf("InjectInfo: forwarding message id=%s with energy=%d", id, info.Energy)
+		log.Printf("InjectInfo: forwarding message id=%s with energy=%.2f", id, info.Energy)
 		go s.forwardToNeighbors(info)
 	} else {
 		log.Printf("InjectInfo: message id=%s has no energy, not forwarding", id)
@@ -147,7 +149,7 @@ func (s *Service) InjectInfo(infoType string, content []byte, energy float64, tt
 
 // HandleInfoMessage processes incoming information messages and forwards them
 func (s *Service) HandleInfoMessage(msg *types.InfoMessage, fromNodeID string) error {
-	log.Printf("HandleInfoMessage: received message id=%s from=%s energy=%d hops=%d",
+	log.Printf("HandleInfoMessage: received message id=%s from=%s energy=%.2f hops=%d",
 		msg.ID, fromNodeID, msg.Energy, msg.Hops)
 
 	// Check if we already have this message (deduplication)
@@ -162,6 +164,7 @@ func (s *Service) HandleInfoMessage(msg *types.InfoMessage, fromNodeID string) e
 	// Store the message locally
 	s.mu.Lock()
 	s.storage[msg.ID] = msg
+	s.version++
 	s.mu.Unlock()
 
 	log.Printf("HandleInfoMessage: stored message id=%s", msg.ID)
@@ -180,7 +183,7 @@ func (s *Service) HandleInfoMessage(msg *types.InfoMessage, fromNodeID string) e
 
 	// Forward to neighbors if energy > 0
 	if msg.Energy > 0 {
-		log.Printf("HandleInfoMessage: forwarding message id=%s with energy=%d", msg.ID, msg.Energy)
+		log.Printf("HandleInfoMessage: forwarding message id=%s with energy=%.2f", msg.ID, msg.Energy)
 		go s.forwardToNeighbors(msg)
 	} else {
 		log.Printf("HandleInfoMessage: message id=%s has no energy, not forwarding", msg.ID)
@@ -205,6 +208,13 @@ func (s *Service) GetAllInfo() map[string]*types.InfoMessage {
 	return result
 }
 
+// Version returns a counter that changes whenever stored information changes
+func (s *Service) Version() uint64 {
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+	return s.version
+}
+
 // GetInfo returns specific information by ID
 func (s *Service) GetInfo(id string) (*types.InfoMessage, bool) {
 	s.mu.RLock()
@@ -289,6 +299,9 @@ func (s *Service) cleanup() {
 			removed++
 		}
 	}
+	if removed > 0 {
+		s.version++
+	}
 	s.mu.Unlock()
 
 	if removed > 0 {
@@ -355,7 +368,7 @@ func (s *Service) forwardToNeighbors(msg *types.InfoMessage) {
 			if shouldForwardToNeighbor {
 				// Create a forwarded copy with updated energy and path
 				forwardedMsg := s.createForwardedMessage(msg, neighbor.NodeID)
-				log.Printf("Forwarding message %s to %s (energy: %d→%d, hops: %d→%d)",
+				log.Printf("Forwarding message %s to %s (energy: %.2f→%.2f, hops: %d→%d)",
 					msg.ID, neighbor.NodeID, msg.Energy, forwardedMsg.Energy, msg.Hops, forwardedMsg.Hops)
 
 				err := s.comm.SendInfoMessage(neighbor.NodeID, neighbor.Address, neighbor.Port, forwardedMsg)
@@ -467,6 +480,7 @@ func (s *Service) processChemistryForNewMessage(newMsg *types.InfoMessage) {
 		for _, product := range products {
 			if _, exists := s.storage[product.ID]; !exists {
 				s.storage[product.ID] = product
+				s.version++
 				log.Printf("Chemistry: Created product message %s from reaction", product.ID)
 			}
 		}
@@ -1,16 +1,20 @@
 package discovery
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"log"
 	"net"
+	"strconv"
 	"sync"
 	"time"
 
 	"github.com/BasicAcid/ryx/internal/config"
 	"github.com/BasicAcid/ryx/internal/spatial"
+	"github.com/BasicAcid/ryx/internal/transport"
 	"github.com/BasicAcid/ryx/internal/types"
 )
 
@@ -54,14 +58,34 @@ type Service struct {
 	ctx       context.Context
 	cancel    context.CancelFunc
 
+	// neighborSnapshot is an immutable view of neighbors, rebuilt whenever the set changes
+	neighborSnapshot []*types.Neighbor
+
 	// Phase 3B: Performance-based neighbor selection
 	runtimeParams *config.RuntimeParameters
 	behaviorMod   config.BehaviorModifier
 
 	// Phase 3C.2: Spatial awareness
 	spatialConfig *spatial.SpatialConfig
+
+	// announcePackets holds one packet per discovery port, resolved once at startup
+	announcePackets []transport.Packet
+
+	// Encoded announcement split around the timestamp value, plus the buffer it is spliced into
+	announcePrefix []byte
+	announceSuffix []byte
+	announceBuf    []byte
 }
 
+// announceTimestampField marks where the timestamp value sits in an encoded announcement
+var announceTimestampField = []byte(`"timestamp":0`)
+
+// Discovery port range probed by announcements (for local testing)
+const (
+	announceBasePort  = 10000
+	announcePortCount = 20
+)
+
 // New creates a new discovery service
 func New(port int, clusterID, nodeID string) (*Service, error) {
 	return &Service{
@@ -119,16 +143,23 @@ func (s *Service) Start(ctx context.Context) error {
 		return fmt.Errorf("failed to listen on UDP port %d: %w", discoveryPort, err)
 	}
 
+	if err := transport.ConfigureBuffers(s.conn, transport.DefaultReadBuffer, transport.DefaultWriteBuffer); err != nil {
+		log.Printf("Warning: failed to configure UDP buffers on port %d: %v", discoveryPort, err)
+	}
+
 	log.Printf("Discovery service listening on port %d", discoveryPort)
 
+	s.announcePackets = buildAnnouncePackets(discoveryPort)
+	if err := s.buildAnnounceTemplate(); err != nil {
+		s.conn.Close()
+		return err
+	}
+
 	// Start listening for announcements
 	go s.listenLoop()
 
-	// Start periodic announcements
-	go s.announceLoop()
-
-	// Start cleanup routine
-	go s.cleanupLoop()
+	// Start periodic announcements and stale neighbor cleanup
+	go s.maintenanceLoop()
 
 	// Phase 3B: DISABLED topology optimization routine to prevent deadlocks
 	// go s.topologyOptimizationLoop()
@@ -151,16 +182,26 @@ func (s *Service) GetNeighbors() []*types.Neighbor {
 	s.mu.RLock()
 	defer s.mu.RUnlock()
 
-	neighbors := make([]*types.Neighbor, 0, len(s.neighbors))
+	// The snapshot is shared between callers and must be treated as read-only
+	if s.neighborSnapshot == nil {
+		return []*types.Neighbor{}
+	}
+	return s.neighborSnapshot
+}
+
+// rebuildNeighborSnapshot replaces the neighbor snapshot after the set has changed.
+// The caller must hold s.mu for writing.
+func (s *Service) rebuildNeighborSnapshot() {
+	snapshot := make([]*types.Neighbor, 0, len(s.neighbors))
 	for _, neighbor := range s.neighbors {
-		neighbors = append(neighbors, &types.Neighbor{
+		snapshot = append(snapshot, &types.Neighbor{
 			NodeID:    neighbor.NodeID,
 			Address:   neighbor.Address,
 			Port:      neighbor.Port,
 			ClusterID: neighbor.ClusterID,
 		})
 	}
-	return neighbors
+	s.neighborSnapshot = snapshot
 }
 
 // GetNeighborsMap returns current neighbors as a map for backward compatibility
@@ -180,21 +221,24 @@ func (s *Service) GetNeighborsMap() map[string]*Neighbor {
 
 // listenLoop listens for incoming announcements
 func (s *Service) listenLoop() {
-	buffer := make([]byte, 1024)
+	// Drain up to 32 queued datagrams per read; 2 KiB leaves headroom for
+	// announcements carrying spatial coordinates and barrier lists
+	reader := transport.NewBatchReader(s.conn, 32, 2048)
 
+	// Block until data arrives; Stop closes the socket to wake us up
 	for {
-		select {
-		case <-s.ctx.Done():
-			return
-		default:
-			s.conn.SetReadDeadline(time.Now().Add(1 * time.Second))
-			n, addr, err := s.conn.ReadFromUDP(buffer)
-			if err != nil {
-				// Timeout is expected, continue
-				continue
+		n, err := reader.Read()
+		if err != nil {
+			if s.ctx.Err() != nil || errors.Is(err, net.ErrClosed) {
+				return
 			}
+			log.Printf("Warning: discovery read failed: %v", err)
+			continue
+		}
 
-			s.handleAnnouncement(buffer[:n], addr)
+		for i := 0; i < n; i++ {
+			data, addr := reader.Packet(i)
+			s.handleAnnouncement(data, addr)
 		}
 	}
 }
@@ -276,6 +320,11 @@ func (s *Service) handleAnnouncement(data []byte, addr *net.UDPAddr) {
 			s.removeWorstNeighbor()
 		}
 
+		// Only rebuild the snapshot when the advertised endpoint is new or has moved
+		existing, known := s.neighbors[msg.NodeID]
+		changed := !known || existing.Address != candidate.Address ||
+			existing.Port != candidate.Port || existing.ClusterID != candidate.ClusterID
+
 		s.neighbors[msg.NodeID] = &Neighbor{
 			NodeID:        msg.NodeID,
 			Address:       addr.IP.String(),
@@ -285,6 +334,9 @@ func (s *Service) handleAnnouncement(data []byte, addr *net.UDPAddr) {
 			SpatialConfig: neighborSpatialConfig,
 			Distance:      distance,
 		}
+		if changed {
+			s.rebuildNeighborSnapshot()
+		}
 		s.mu.Unlock()
 
 		log.Printf("Added neighbor %s (total: %d)", msg.NodeID, len(s.neighbors))
@@ -293,10 +345,13 @@ func (s *Service) handleAnnouncement(data []byte, addr *net.UDPAddr) {
 	}
 }
 
-// announceLoop periodically broadcasts our presence
-func (s *Service) announceLoop() {
-	ticker := time.NewTicker(5 * time.Second)
-	defer ticker.Stop()
+// maintenanceLoop periodically broadcasts our presence and removes stale neighbors
+// from a single goroutine
+func (s *Service) maintenanceLoop() {
+	announceTicker := time.NewTicker(5 * time.Second)
+	defer announceTicker.Stop()
+	cleanupTicker := time.NewTicker(30 * time.Second)
+	defer cleanupTicker.Stop()
 
 	// Send initial announcement immediately
 	s.sendAnnouncement()
@@ -305,20 +360,22 @@ func (s *Service) announceLoop() {
 		select {
 		case <-s.ctx.Done():
 			return
-		case <-ticker.C:
+		case <-announceTicker.C:
 			s.sendAnnouncement()
+		case <-cleanupTicker.C:
+			s.cleanup()
 		}
 	}
 }
 
-// sendAnnouncement broadcasts our presence to a range of discovery ports
-func (s *Service) sendAnnouncement() {
+// buildAnnounceTemplate encodes our announcement once and splits it around the
+// timestamp, the only field that changes between announcements
+func (s *Service) buildAnnounceTemplate() error {
 	msg := AnnounceMessage{
 		Type:      "announce",
 		NodeID:    s.nodeID,
 		ClusterID: s.clusterID,
 		Port:      s.port,
-		Timestamp: time.Now().Unix(),
 	}
 
 	// Phase 3C.2: Include spatial information if available
@@ -332,49 +389,56 @@ func (s *Service) sendAnnouncement() {
 
 	data, err := json.Marshal(msg)
 	if err != nil {
-		log.Printf("Failed to marshal announcement: %v", err)
-		return
+		return fmt.Errorf("failed to marshal announcement: %w", err)
 	}
 
-	// Broadcast to a range of discovery ports (for local testing)
-	// This allows nodes with different base ports to find each other
-	basePort := 10000
-	for i := 0; i < 20; i++ { // Try ports 10000-10019
-		discoveryPort := basePort + i
-
-		// Skip our own port to avoid self-messages
-		if discoveryPort == s.port+1000 {
-			continue
-		}
+	// Quotes inside string values are escaped, so only the real field can match
+	idx := bytes.Index(data, announceTimestampField)
+	if idx < 0 {
+		return fmt.Errorf("failed to locate timestamp in announcement")
+	}
 
-		broadcastAddr, err := net.ResolveUDPAddr("udp", fmt.Sprintf("127.0.0.1:%d", discoveryPort))
-		if err != nil {
-			continue
-		}
+	valueStart := idx + len(announceTimestampField) - 1
+	s.announcePrefix = data[:valueStart]
+	s.announceSuffix = data[valueStart+1:]
+	s.announceBuf = make([]byte, 0, len(data)+20)
+	return nil
+}
 
-		conn, err := net.DialUDP("udp", nil, broadcastAddr)
-		if err != nil {
-			continue
-		}
+// sendAnnouncement broadcasts our presence to a range of discovery ports
+func (s *Service) sendAnnouncement() {
+	data := append(s.announceBuf[:0], s.announcePrefix...)
+	data = strconv.AppendInt(data, time.Now().Unix(), 10)
+	data = append(data, s.announceSuffix...)
+	s.announceBuf = data
 
-		conn.Write(data)
-		conn.Close()
+	// Every target gets the same encoded payload, flushed in one batched send
+	for i := range s.announcePackets {
+		s.announcePackets[i].Data = data
+	}
+	if sent, err := transport.WriteBatch(s.conn, s.announcePackets); err != nil {
+		log.Printf("Failed to send announcement to %d of %d ports: %v",
+			len(s.announcePackets)-sent, len(s.announcePackets), err)
 	}
 }
 
-// cleanupLoop removes stale neighbors
-func (s *Service) cleanupLoop() {
-	ticker := time.NewTicker(30 * time.Second)
-	defer ticker.Stop()
+// buildAnnouncePackets resolves the range of discovery ports once.
+// This allows nodes with different base ports to find each other.
+func buildAnnouncePackets(ownPort int) []transport.Packet {
+	packets := make([]transport.Packet, 0, announcePortCount)
+	for i := 0; i < announcePortCount; i++ {
+		discoveryPort := announceBasePort + i
 
-	for {
-		select {
-		case <-s.ctx.Done():
-			return
-		case <-ticker.C:
-			s.cleanup()
+		// Skip our own port to avoid self-messages
+		if discoveryPort == ownPort {
+			continue
 		}
+
+		packets = append(packets, transport.Packet{
+			Addr: &net.UDPAddr{IP: net.IPv4(127, 0, 0, 1), Port: discoveryPort},
+		})
 	}
+	return packets
 }
 
 // cleanup removes neighbors not seen recently
@@ -383,12 +447,18 @@ func (s *Service) cleanup() {
 	defer s.mu.Unlock()
 
 	cutoff := time.Now().Add(-60 * time.Second) // 60 second timeout
+	removed := false
 	for nodeID, neighbor := range s.neighbors {
 		if neighbor.LastSeen.Before(cutoff) {
 			log.Printf("Removing stale neighbor: %s", nodeID)
 			delete(s.neighbors, nodeID)
+			removed = true
 		}
 	}
+
+	if removed {
+		s.rebuildNeighborSnapshot()
+	}
 }
 
 // Phase 3B: Performance-based topology optimization
@@ -445,13 +515,19 @@ func (s *Service) optimizeTopology() {
 	}
 
 	// Remove poor performers (but maintain minimum count)
+	removed := false
 	for _, nodeID := range toRemove {
 		if len(s.neighbors) > minNeighbors {
 			log.Printf("Removing poor-performing neighbor: %s", nodeID)
 			delete(s.neighbors, nodeID)
+			removed = true
 		}
 	}
 
+	if removed {
+		s.rebuildNeighborSnapshot()
+	}
+
 	log.Printf("Topology optimization completed. Current neighbors: %d", len(s.neighbors))
 }
 
@@ -484,6 +560,7 @@ func (s *Service) removeWorstNeighbor() {
 		if worstNodeID != "" {
 			log.Printf("Removing worst neighbor %s (score: %.3f) to make room", worstNodeID, worstScore)
 			delete(s.neighbors, worstNodeID)
+			s.rebuildNeighborSnapshot()
 		}
 	}
 }
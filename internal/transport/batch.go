@@ -0,0 +1,81 @@
+package transport
+
+import (
+	"net"
+)
+
+// MaxBatchSize caps the number of datagrams handed to the kernel in a single batched syscall
+const MaxBatchSize = 100
+
+// Packet is a single outbound UDP datagram
+type Packet struct {
+	Data []byte
+	Addr *net.UDPAddr
+
+	// Err is set by WriteBatch to the outcome of sending this packet (nil once sent)
+	Err error
+}
+
+// writeLoop sends packets one at a time (portable fallback for WriteBatch).
+// A failed packet does not stop the ones after it.
+func writeLoop(conn *net.UDPConn, packets []Packet) (int, error) {
+	for i := range packets {
+		_, packets[i].Err = conn.WriteToUDP(packets[i].Data, packets[i].Addr)
+	}
+	return batchResult(packets)
+}
+
+// batchResult counts the packets that were sent and returns the first failure
+func batchResult(packets []Packet) (int, error) {
+	sent := 0
+	var firstErr error
+	for _, packet := range packets {
+		if packet.Err == nil {
+			sent++
+		} else if firstErr == nil {
+			firstErr = packet.Err
+		}
+	}
+	return sent, firstErr
+}
+
+// BatchReader receives datagrams in batches into preallocated, reused buffers
+type BatchReader struct {
+	conn  *net.UDPConn
+	bufs  [][]byte
+	sizes []int
+	addrs []*net.UDPAddr
+	state readerState
+}
+
+// NewBatchReader creates a reader that receives up to batchSize datagrams
+// of at most bufSize bytes per Read call
+func NewBatchReader(conn *net.UDPConn, batchSize, bufSize int) *BatchReader {
+	r := &BatchReader{
+		conn:  conn,
+		bufs:  make([][]byte, batchSize),
+		sizes: make([]int, batchSize),
+		addrs: make([]*net.UDPAddr, batchSize),
+	}
+	for i := range r.bufs {
+		r.bufs[i] = make([]byte, bufSize)
+	}
+	r.state.init(r)
+	return r
+}
+
+// Packet returns the i-th datagram received by the last Read.
+// The data is only valid until the next call to Read.
+func (r *BatchReader) Packet(i int) ([]byte, *net.UDPAddr) {
+	return r.bufs[i][:r.sizes[i]], r.addrs[i]
+}
+
+// readOne receives a single datagram (portable fallback for Read)
+func (r *BatchReader) readOne() (int, error) {
+	n, addr, err := r.conn.ReadFromUDP(r.bufs[0])
+	if err != nil {
+		return 0, err
+	}
+	r.sizes[0], r.addrs[0] = n, addr
+	return 1, nil
+}
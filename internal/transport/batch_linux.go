@@ -0,0 +1,298 @@
+//go:build linux && (amd64 || arm64)
+
+package transport
+
+import (
+	"errors"
+	"fmt"
+	"net"
+	"os"
+	"runtime"
+	"syscall"
+	"unsafe"
+)
+
+// mmsghdr mirrors struct mmsghdr from <sys/socket.h>
+type mmsghdr struct {
+	hdr syscall.Msghdr
+	len uint32
+}
+
+// WriteBatch sends all packets on conn and returns how many were sent along with the
+// first error. Each packet's own outcome is left in its Err field: a packet that cannot be
+// sent (bad address, send error) is skipped and the rest of the batch still goes out.
+// On Linux the datagrams are flushed with sendmmsg(2), up to MaxBatchSize per syscall.
+func WriteBatch(conn *net.UDPConn, packets []Packet) (int, error) {
+	if len(packets) == 0 {
+		return 0, nil
+	}
+
+	rawConn, err := conn.SyscallConn()
+	if err != nil {
+		return writeLoop(conn, packets)
+	}
+
+	family, err := socketFamily(rawConn)
+	if err != nil {
+		return writeLoop(conn, packets)
+	}
+
+	batch := newSendBatch(family, packets)
+	pos := 0
+	for pos < len(batch.index) {
+		end := pos + MaxBatchSize
+		if end > len(batch.index) {
+			end = len(batch.index)
+		}
+
+		n, err := batch.send(rawConn, pos, end)
+		pos += n
+		if err == nil {
+			continue
+		}
+
+		if errors.Is(err, syscall.ENOSYS) {
+			// Kernel without sendmmsg - send the remainder individually
+			for _, i := range batch.index[pos:] {
+				_, packets[i].Err = conn.WriteToUDP(packets[i].Data, packets[i].Addr)
+			}
+			break
+		}
+
+		// The kernel stops at the first datagram it cannot send; record it and carry on
+		packets[batch.index[pos]].Err = err
+		pos++
+	}
+
+	runtime.KeepAlive(packets)
+	return batchResult(packets)
+}
+
+// sendBatch holds the sendmmsg(2) headers for the sendable packets of one WriteBatch call
+type sendBatch struct {
+	hdrs   []mmsghdr
+	iovs   []syscall.Iovec
+	names4 []syscall.RawSockaddrInet4
+	names6 []syscall.RawSockaddrInet6
+
+	// index maps each header back to its position in the packets slice
+	index []int
+}
+
+// newSendBatch builds headers for every packet with a usable destination.
+// Packets that cannot be addressed on this socket get their Err set and are left out.
+func newSendBatch(family int, packets []Packet) *sendBatch {
+	b := &sendBatch{
+		hdrs:  make([]mmsghdr, 0, len(packets)),
+		iovs:  make([]syscall.Iovec, len(packets)),
+		index: make([]int, 0, len(packets)),
+	}
+	if family == syscall.AF_INET6 {
+		b.names6 = make([]syscall.RawSockaddrInet6, len(packets))
+	} else {
+		b.names4 = make([]syscall.RawSockaddrInet4, len(packets))
+	}
+
+	for i := range packets {
+		packet := &packets[i]
+		packet.Err = nil
+
+		var hdr mmsghdr
+		switch {
+		case packet.Addr == nil:
+			packet.Err = fmt.Errorf("packet %d has no destination address", i)
+		case family == syscall.AF_INET6:
+			fillSockaddrInet6(&b.names6[i], packet.Addr)
+			hdr.hdr.Name = (*byte)(unsafe.Pointer(&b.names6[i]))
+			hdr.hdr.Namelen = syscall.SizeofSockaddrInet6
+		default:
+			ip4 := packet.Addr.IP.To4()
+			if ip4 == nil {
+				packet.Err = fmt.Errorf("cannot send to %s on an IPv4 socket", packet.Addr)
+				break
+			}
+			fillSockaddrInet4(&b.names4[i], ip4, packet.Addr.Port)
+			hdr.hdr.Name = (*byte)(unsafe.Pointer(&b.names4[i]))
+			hdr.hdr.Namelen = syscall.SizeofSockaddrInet4
+		}
+		if packet.Err != nil {
+			continue
+		}
+
+		if len(packet.Data) > 0 {
+			b.iovs[i].Base = &packet.Data[0]
+		}
+		b.iovs[i].SetLen(len(packet.Data))
+		hdr.hdr.Iov = &b.iovs[i]
+		hdr.hdr.Iovlen = 1
+
+		b.hdrs = append(b.hdrs, hdr)
+		b.index = append(b.index, i)
+	}
+	return b
+}
+
+// send hands headers [start, end) to the kernel in a single sendmmsg(2) call and returns
+// how many datagrams were accepted. An error means the datagram at start+n was not sent.
+func (b *sendBatch) send(rawConn syscall.RawConn, start, end int) (int, error) {
+	hdrs := b.hdrs[start:end]
+
+	var sent int
+	var errno syscall.Errno
+	err := rawConn.Write(func(fd uintptr) bool {
+		r, _, e := syscall.Syscall6(sysSendmmsg, fd,
+			uintptr(unsafe.Pointer(&hdrs[0])), uintptr(len(hdrs)), 0, 0, 0)
+		if e == syscall.EAGAIN || e == syscall.EINTR {
+			return false // Wait until the socket is writable again
+		}
+		sent, errno = int(r), e
+		return true
+	})
+
+	runtime.KeepAlive(b)
+
+	if err != nil {
+		return 0, err
+	}
+	if errno != 0 {
+		return 0, os.NewSyscallError("sendmmsg", errno)
+	}
+	return sent, nil
+}
+
+// readerState holds the recvmmsg(2) headers, built once and reused for every Read
+type readerState struct {
+	rawConn  syscall.RawConn
+	hdrs     []mmsghdr
+	iovs     []syscall.Iovec
+	names    []syscall.RawSockaddrAny
+	disabled bool
+}
+
+func (st *readerState) init(r *BatchReader) {
+	rawConn, err := r.conn.SyscallConn()
+	if err != nil || len(r.bufs) == 0 {
+		st.disabled = true
+		return
+	}
+
+	st.rawConn = rawConn
+	st.hdrs = make([]mmsghdr, len(r.bufs))
+	st.iovs = make([]syscall.Iovec, len(r.bufs))
+	st.names = make([]syscall.RawSockaddrAny, len(r.bufs))
+
+	for i, buf := range r.bufs {
+		if len(buf) > 0 {
+			st.iovs[i].Base = &buf[0]
+		}
+		st.iovs[i].SetLen(len(buf))
+		st.hdrs[i].hdr.Iov = &st.iovs[i]
+		st.hdrs[i].hdr.Iovlen = 1
+	}
+}
+
+// Read blocks until at least one datagram arrives and returns how many were received.
+// On Linux all queued datagrams (up to the batch size) are drained with one recvmmsg(2).
+func (r *BatchReader) Read() (int, error) {
+	st := &r.state
+	if st.disabled {
+		return r.readOne()
+	}
+
+	for i := range st.hdrs {
+		st.hdrs[i].hdr.Name = (*byte)(unsafe.Pointer(&st.names[i]))
+		st.hdrs[i].hdr.Namelen = syscall.SizeofSockaddrAny
+		st.hdrs[i].hdr.Flags = 0
+		st.hdrs[i].len = 0
+	}
+
+	var received int
+	var errno syscall.Errno
+	err := st.rawConn.Read(func(fd uintptr) bool {
+		n, _, e := syscall.Syscall6(syscall.SYS_RECVMMSG, fd,
+			uintptr(unsafe.Pointer(&st.hdrs[0])), uintptr(len(st.hdrs)), syscall.MSG_DONTWAIT, 0, 0)
+		if e == syscall.EAGAIN || e == syscall.EINTR {
+			return false // Wait until the socket is readable (honours read deadlines)
+		}
+		received, errno = int(n), e
+		return true
+	})
+
+	if err != nil {
+		return 0, err
+	}
+	if errno == syscall.ENOSYS {
+		// Kernel without recvmmsg - stick to single reads from now on
+		st.disabled = true
+		return r.readOne()
+	}
+	if errno != 0 {
+		return 0, errno
+	}
+
+	for i := 0; i < received; i++ {
+		r.sizes[i] = int(st.hdrs[i].len)
+		r.addrs[i] = sockaddrToUDPAddr(&st.names[i])
+	}
+
+	return received, nil
+}
+
+// sockaddrToUDPAddr decodes a kernel-filled source address
+func sockaddrToUDPAddr(rsa *syscall.RawSockaddrAny) *net.UDPAddr {
+	switch rsa.Addr.Family {
+	case syscall.AF_INET:
+		sa := (*syscall.RawSockaddrInet4)(unsafe.Pointer(rsa))
+		p := (*[2]byte)(unsafe.Pointer(&sa.Port))
+		ip := make(net.IP, net.IPv4len)
+		copy(ip, sa.Addr[:])
+		return &net.UDPAddr{IP: ip, Port: int(p[0])<<8 | int(p[1])}
+	case syscall.AF_INET6:
+		sa := (*syscall.RawSockaddrInet6)(unsafe.Pointer(rsa))
+		p := (*[2]byte)(unsafe.Pointer(&sa.Port))
+		ip := make(net.IP, net.IPv6len)
+		copy(ip, sa.Addr[:])
+		return &net.UDPAddr{IP: ip, Port: int(p[0])<<8 | int(p[1])}
+	}
+	return &net.UDPAddr{}
+}
+
+// socketFamily returns the address family the socket was opened with
+func socketFamily(rawConn syscall.RawConn) (int, error) {
+	var family int
+	var sockErr error
+	err := rawConn.Control(func(fd uintptr) {
+		sa, err := syscall.Getsockname(int(fd))
+		if err != nil {
+			sockErr = err
+			return
+		}
+		switch sa.(type) {
+		case *syscall.SockaddrInet6:
+			family = syscall.AF_INET6
+		default:
+			family = syscall.AF_INET
+		}
+	})
+	if err != nil {
+		return 0, err
+	}
+	return family, sockErr
+}
+
+func fillSockaddrInet4(sa *syscall.RawSockaddrInet4, ip net.IP, port int) {
+	sa.Family = syscall.AF_INET
+	p := (*[2]byte)(unsafe.Pointer(&sa.Port))
+	p[0] = byte(port >> 8)
+	p[1] = byte(port)
+	copy(sa.Addr[:], ip)
+}
+
+// fillSockaddrInet6 encodes addr for a dual-stack socket (IPv4 becomes v4-mapped)
+func fillSockaddrInet6(sa *syscall.RawSockaddrInet6, addr *net.UDPAddr) {
+	sa.Family = syscall.AF_INET6
+	p := (*[2]byte)(unsafe.Pointer(&sa.Port))
+	p[0] = byte(addr.Port >> 8)
+	p[1] = byte(addr.Port)
+	copy(sa.Addr[:], addr.IP.To16())
+}
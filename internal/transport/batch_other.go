@@ -0,0 +1,24 @@
+//go:build !linux || !(amd64 || arm64)
+
+package transport
+
+import (
+	"net"
+)
+
+// WriteBatch sends all packets on conn and returns how many were sent along with the
+// first error. Each packet's own outcome is left in its Err field.
+// Batched syscalls are only available on Linux, so this sends one datagram at a time.
+func WriteBatch(conn *net.UDPConn, packets []Packet) (int, error) {
+	return writeLoop(conn, packets)
+}
+
+// readerState holds no platform state where batched receives are unavailable
+type readerState struct{}
+
+func (st *readerState) init(r *BatchReader) {}
+
+// Read blocks until a datagram arrives and returns the number received (always 1)
+func (r *BatchReader) Read() (int, error) {
+	return r.readOne()
+}
@@ -0,0 +1,162 @@
+package transport
+
+import (
+	"fmt"
+	"net"
+	"testing"
+	"time"
+)
+
+// received is a datagram collected by a BatchReader
+type received struct {
+	data string
+	addr *net.UDPAddr
+}
+
+func listenUDP(t *testing.T, network, address string) *net.UDPConn {
+	t.Helper()
+	conn, err := net.ListenUDP(network, mustResolve(t, network, address))
+	if err != nil {
+		t.Skipf("cannot listen on %s %s: %v", network, address, err)
+	}
+	t.Cleanup(func() { conn.Close() })
+	return conn
+}
+
+func mustResolve(t *testing.T, network, address string) *net.UDPAddr {
+	t.Helper()
+	addr, err := net.ResolveUDPAddr(network, address)
+	if err != nil {
+		t.Fatalf("failed to resolve %s: %v", address, err)
+	}
+	return addr
+}
+
+// collect reads want datagrams from conn through a BatchReader in the background
+func collect(t *testing.T, conn *net.UDPConn, want int) <-chan []received {
+	t.Helper()
+	conn.SetReadBuffer(1 << 20)
+	conn.SetReadDeadline(time.Now().Add(5 * time.Second))
+
+	out := make(chan []received, 1)
+	go func() {
+		reader := NewBatchReader(conn, 16, 512)
+		var got []received
+		for len(got) < want {
+			n, err := reader.Read()
+			if err != nil {
+				break
+			}
+			for i := 0; i < n; i++ {
+				data, addr := reader.Packet(i)
+				got = append(got, received{data: string(data), addr: addr})
+			}
+		}
+		out <- got
+	}()
+	return out
+}
+
+func TestWriteBatchRoundTrip(t *testing.T) {
+	tests := []struct {
+		name     string
+		network  string
+		listen   string
+		sendTo   string
+		loopback string
+	}{
+		{name: "udp4", network: "udp4", listen: "127.0.0.1:0", sendTo: "127.0.0.1", loopback: "127.0.0.1"},
+		{name: "dual-stack", network: "udp", listen: ":0", sendTo: "127.0.0.1", loopback: "127.0.0.1"},
+		{name: "udp6", network: "udp6", listen: "[::1]:0", sendTo: "::1", loopback: "::1"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			receiver := listenUDP(t, tt.network, tt.listen)
+			sender := listenUDP(t, tt.network, tt.listen)
+
+			target := &net.UDPAddr{
+				IP:   net.ParseIP(tt.sendTo),
+				Port: receiver.LocalAddr().(*net.UDPAddr).Port,
+			}
+
+			// More than one sendmmsg chunk
+			count := 2*MaxBatchSize + 5
+			packets := make([]Packet, count)
+			for i := range packets {
+				packets[i] = Packet{Data: []byte(fmt.Sprintf("packet-%d", i)), Addr: target}
+			}
+
+			results := collect(t, receiver, count)
+			sent, err := WriteBatch(sender, packets)
+			if err != nil || sent != count {
+				t.Fatalf("WriteBatch = %d, %v; want %d, nil", sent, err, count)
+			}
+
+			got := <-results
+			if len(got) != count {
+				t.Fatalf("received %d datagrams, want %d", len(got), count)
+			}
+
+			senderPort := sender.LocalAddr().(*net.UDPAddr).Port
+			seen := make(map[string]bool, count)
+			for _, r := range got {
+				seen[r.data] = true
+				if r.addr == nil || r.addr.Port != senderPort || !r.addr.IP.Equal(net.ParseIP(tt.loopback)) {
+					t.Fatalf("datagram %q has source %v, want %s port %d", r.data, r.addr, tt.loopback, senderPort)
+				}
+			}
+			for i := range packets {
+				if !seen[string(packets[i].Data)] {
+					t.Errorf("datagram %q was not received", packets[i].Data)
+				}
+			}
+		})
+	}
+}
+
+func TestWriteBatchSkipsInvalidAddress(t *testing.T) {
+	receiver := listenUDP(t, "udp4", "127.0.0.1:0")
+	sender := listenUDP(t, "udp4", "127.0.0.1:0")
+	port := receiver.LocalAddr().(*net.UDPAddr).Port
+
+	packets := []Packet{
+		{Data: []byte("ipv6"), Addr: &net.UDPAddr{IP: net.ParseIP("::1"), Port: port}},
+		{Data: []byte("no-address")},
+		{Data: []byte("valid"), Addr: &net.UDPAddr{IP: net.ParseIP("127.0.0.1"), Port: port}},
+	}
+
+	results := collect(t, receiver, 1)
+	sent, err := WriteBatch(sender, packets)
+	if sent != 1 || err == nil {
+		t.Fatalf("WriteBatch = %d, %v; want 1 and an error", sent, err)
+	}
+	if packets[0].Err == nil || packets[1].Err == nil {
+		t.Errorf("invalid packets were not flagged: %v, %v", packets[0].Err, packets[1].Err)
+	}
+	if packets[2].Err != nil {
+		t.Errorf("valid packet failed: %v", packets[2].Err)
+	}
+
+	got := <-results
+	if len(got) != 1 || got[0].data != "valid" {
+		t.Fatalf("received %v, want only the valid datagram", got)
+	}
+
+	// Results from the previous call must not carry over to a reused packet slice
+	packets[0].Addr = packets[2].Addr
+	packets[1].Addr = packets[2].Addr
+	results = collect(t, receiver, len(packets))
+	sent, err = WriteBatch(sender, packets)
+	if sent != len(packets) || err != nil {
+		t.Fatalf("WriteBatch = %d, %v; want %d, nil", sent, err, len(packets))
+	}
+	for i := range packets {
+		if packets[i].Err != nil {
+			t.Errorf("packet %d kept a stale error: %v", i, packets[i].Err)
+		}
+	}
+	if got := <-results; len(got) != len(packets) {
+		t.Fatalf("received %d datagrams, want %d", len(got), len(packets))
+	}
+}
@@ -0,0 +1,28 @@
+package transport
+
+import (
+	"fmt"
+	"net"
+)
+
+const (
+	// DefaultReadBuffer is the SO_RCVBUF requested for node sockets
+	DefaultReadBuffer = 8 * 1024 * 1024
+
+	// DefaultWriteBuffer is the SO_SNDBUF requested for node sockets
+	DefaultWriteBuffer = 1 * 1024 * 1024
+)
+
+// ConfigureBuffers raises the kernel socket buffers on conn so that bursts of
+// datagrams are queued instead of being silently dropped
+func ConfigureBuffers(conn *net.UDPConn, readBytes, writeBytes int) error {
+	if err := conn.SetReadBuffer(readBytes); err != nil {
+		return fmt.Errorf("failed to set read buffer: %w", err)
+	}
+	if err := conn.SetWriteBuffer(writeBytes); err != nil {
+		return fmt.Errorf("failed to set write buffer: %w", err)
+	}
+
+	warnIfClamped(conn, readBytes, writeBytes)
+	return nil
+}
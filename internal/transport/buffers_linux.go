@@ -0,0 +1,26 @@
+package transport
+
+import (
+	"log"
+	"net"
+	"syscall"
+)
+
+// warnIfClamped reports when the kernel capped the requested buffer sizes
+// (net.core.rmem_max / net.core.wmem_max need to be raised)
+func warnIfClamped(conn *net.UDPConn, readBytes, writeBytes int) {
+	rawConn, err := conn.SyscallConn()
+	if err != nil {
+		return
+	}
+
+	rawConn.Control(func(fd uintptr) {
+		// Linux reports double the requested size to account for bookkeeping overhead
+		if got, err := syscall.GetsockoptInt(int(fd), syscall.SOL_SOCKET, syscall.SO_RCVBUF); err == nil && got/2 < readBytes {
+			log.Printf("Warning: UDP read buffer clamped to %d bytes (requested %d), raise net.core.rmem_max", got/2, readBytes)
+		}
+		if got, err := syscall.GetsockoptInt(int(fd), syscall.SOL_SOCKET, syscall.SO_SNDBUF); err == nil && got/2 < writeBytes {
+			log.Printf("Warning: UDP write buffer clamped to %d bytes (requested %d), raise net.core.wmem_max", got/2, writeBytes)
+		}
+	})
+}
@@ -0,0 +1,10 @@
+//go:build !linux
+
+package transport
+
+import (
+	"net"
+)
+
+// warnIfClamped is a no-op where the effective buffer size cannot be queried reliably
+func warnIfClamped(conn *net.UDPConn, readBytes, writeBytes int) {}
@@ -0,0 +1,4 @@
+package transport
+
+// sendmmsg(2) is missing from the frozen syscall tables, so define it here
+const sysSendmmsg = 307
@@ -78,6 +78,7 @@ type InfoMessageHandler interface {
 // CommunicationService defines the interface for sending messages between nodes
 type CommunicationService interface {
 	SendInfoMessage(nodeID, address string, port int, msg *InfoMessage) error
+	SendInfoMessageBatch(targets []*Neighbor, msg *InfoMessage) error
 }
 
 // DiscoveryService defines the interface for neighbor discovery